@@ -4,7 +4,10 @@ Abstract base classes and minimal core types for bridges framework.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import TYPE_CHECKING, Any, Dict
+
+if TYPE_CHECKING:  # Avoid importing pydantic through .basic at runtime
+    from .basic import Bridge
 
 
 class ParamSource(ABC):
@@ -12,7 +15,7 @@ class ParamSource(ABC):
     Base class for parameter sources.
     """
 
-    pass
+    __slots__ = ()
 
 
 class OutputDestination(ABC):
@@ -20,7 +23,7 @@ class OutputDestination(ABC):
     Base class for output destinations.
     """
 
-    pass
+    __slots__ = ()
 
 
 class IBridge(ABC):
@@ -38,7 +41,7 @@ class BridgeInterface(ABC):
     :param bridge: An instance of a bridge to be used by the interface.
     """
 
-    def __init__(self, bridge):
+    def __init__(self, bridge: "Bridge"):
         self.bridge = bridge
 
     @abstractmethod
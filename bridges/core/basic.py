@@ -5,9 +5,18 @@ Core bridge functionality for registering functions, managing context, and event
 """
 
 import copy
+import functools
 import inspect
-from typing import Any, Callable, Dict, List, Optional
-from pydantic import BaseModel, ValidationError, create_model
+import json
+import re
+import sys
+import warnings
+import weakref
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Union
+from pydantic import BaseModel, ConfigDict, TypeAdapter, ValidationError, create_model
+from pydantic.errors import PydanticSchemaGenerationError, PydanticUserError
+from typing_extensions import NotRequired, Required, TypedDict
 from .errors import BridgeExecutionError, BridgeValidationError
 from .types import ParamSource
 
@@ -17,11 +26,351 @@ except ImportError:
     dateutil_parser = None
 
 
+@functools.lru_cache(maxsize=None)
+def _numba():
+    """
+    Import numba on first use; it is optional and only needed for jit=True.
+    :return: The numba module, or None if it is not installed.
+    """
+    try:
+        import numba
+    except ImportError:
+        return None
+    return numba
+
+
+# Marks a lazily built validator that has not been built yet.
+_UNBUILT = object()
+# Context log value for a key deleted from the context.
+_DELETED = object()
+
+
+def _weak_cache(build: Callable[[Callable], Any]) -> Callable[[Callable], Any]:
+    """
+    Cache build(func) per function object without keeping the function alive.
+    Functions registered by register_class close over their bridge, so a strong cache would leak it.
+    Unhashable or non-weak-referenceable callables are built each time.
+    :param build: Function computing the value for a callable.
+    :return: The caching wrapper.
+    """
+    cache: "weakref.WeakKeyDictionary[Callable, Any]" = weakref.WeakKeyDictionary()
+
+    @functools.wraps(build)
+    def cached(func: Callable) -> Any:
+        try:
+            return cache[func]
+        except KeyError:
+            pass
+        except TypeError:
+            return build(func)
+        value = cache[func] = build(func)
+        return value
+
+    cached.cache = cache
+    return cached
+
+
+@_weak_cache
+def _signature(func: Callable) -> inspect.Signature:
+    """
+    Return the signature of a function, computed once per function object.
+    :param func: The function to inspect.
+    :return: The function's inspect.Signature.
+    """
+    return inspect.signature(func)
+
+
+# Parameter models and TypedDicts shared by functions with identical field specs
+_MODEL_CACHE: Dict[Tuple, Any] = {}
+_PARAMS_DICT_CACHE: Dict[Tuple, Any] = {}
+
+
+def _field_spec(func: Callable) -> Tuple[Tuple[str, Any, Any], ...]:
+    """
+    Describe the function parameters as (name, annotation, default) entries.
+    Unannotated parameters are str and required parameters have default ... (Ellipsis).
+    :param func: The function to describe.
+    :return: Tuple of field entries in signature order.
+    """
+    spec = []
+    for name, param in _signature(func).parameters.items():
+        annotation = (
+            param.annotation if param.annotation != inspect.Parameter.empty else str
+        )
+        default = param.default if param.default != inspect.Parameter.empty else ...
+        spec.append((name, annotation, default))
+    return tuple(spec)
+
+
+def _shared(cache: Dict[Tuple, Any], key: Tuple, build: Callable[[], Any]) -> Any:
+    """
+    Return the cached object for key, building it on a miss.
+    Unhashable keys (e.g. a list default) are built without caching.
+    :param cache: The cache dict.
+    :param key: The field-spec key.
+    :param build: Zero-argument factory for the object.
+    """
+    try:
+        value = cache.get(key)
+    except TypeError:
+        return build()
+    if value is None:
+        value = cache[key] = build()
+    return value
+
+
+@_weak_cache
+def _build_model(func: Callable) -> BaseModel:
+    """
+    Create a Pydantic model for parameter validation based on the function signature.
+    Functions with the same field spec share one model, so its validator is compiled once.
+    Schema compilation is deferred until the model first validates.
+    :param func: The function to create a model for.
+    :return: A dynamically created Pydantic model class.
+    """
+    spec = _field_spec(func)
+    # The default's type is part of the key, since 1 == 1.0 == True
+    key = tuple((name, ann, type(default), default) for name, ann, default in spec)
+    return _shared(
+        _MODEL_CACHE,
+        key,
+        lambda: create_model(
+            "ParamsModel",
+            __config__=ConfigDict(defer_build=True),
+            **{name: (ann, default) for name, ann, default in spec},
+        ),
+    )
+
+
+@_weak_cache
+def _build_params_dict(func: Callable) -> Any:
+    """
+    Create a TypedDict of the function parameters.
+    Parameters with defaults are optional keys, so omitted values fall back to the function's own defaults.
+    Functions with the same names, annotations, and optional keys share one TypedDict.
+    :param func: The function to describe.
+    :return: A TypedDict class.
+    """
+    spec = tuple(
+        (name, ann, default is not ...) for name, ann, default in _field_spec(func)
+    )
+    return _shared(
+        _PARAMS_DICT_CACHE,
+        spec,
+        lambda: TypedDict(
+            "Params",
+            {
+                name: NotRequired[ann] if optional else Required[ann]
+                for name, ann, optional in spec
+            },
+        ),
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _typed_dict_adapter(params_dict: Any, batch: bool) -> Optional[TypeAdapter]:
+    """
+    Create a TypeAdapter over a parameter TypedDict, or over a list of them when batch is True.
+    :param params_dict: TypedDict class from _build_params_dict.
+    :param batch: Validate a list of parameter dicts instead of a single one.
+    :return: A TypeAdapter, or None if the annotations cannot be expressed as a TypedDict.
+    """
+    try:
+        return TypeAdapter(List[params_dict] if batch else params_dict)
+    except (PydanticSchemaGenerationError, TypeError):
+        return None
+
+
+def _build_adapter(func: Callable) -> Optional[TypeAdapter]:
+    """
+    Create a TypeAdapter over a TypedDict of the function parameters.
+    Validating through it returns a plain dict of coerced values, skipping model instantiation.
+    :param func: The function to create an adapter for.
+    :return: A TypeAdapter, or None if the annotations cannot be expressed as a TypedDict.
+    """
+    try:
+        params_dict = _build_params_dict(func)
+    except TypeError:
+        return None
+    return _typed_dict_adapter(params_dict, False)
+
+
+def _build_batch_adapter(func: Callable) -> Optional[TypeAdapter]:
+    """
+    Create a TypeAdapter over a list of the function's parameter TypedDict, validating a whole batch in one pass.
+    :param func: The function to create an adapter for.
+    :return: A TypeAdapter, or None if the annotations cannot be expressed as a TypedDict.
+    """
+    try:
+        params_dict = _build_params_dict(func)
+    except TypeError:
+        return None
+    return _typed_dict_adapter(params_dict, True)
+
+
+# Annotations whose values need no coercion when already of that exact type
+_PASSTHROUGH_TYPES = (str, int, float, bool)
+
+
+def _passthrough_types(sig: inspect.Signature) -> Optional[Dict[str, Any]]:
+    """
+    Map each parameter to the exact type a value must have to skip Pydantic validation.
+    Unannotated parameters validate as str, matching _build_model.
+    :param sig: The function signature.
+    :return: Dict of parameter name to type (or Any), or None if some parameter always needs Pydantic.
+    """
+    types = {}
+    for name, param in sig.parameters.items():
+        if param.kind in (param.VAR_POSITIONAL, param.VAR_KEYWORD):
+            return None
+        annotation = param.annotation
+        if annotation is inspect.Parameter.empty:
+            annotation = str
+        if annotation is not Any and annotation not in _PASSTHROUGH_TYPES:
+            return None
+        types[name] = annotation
+    return types
+
+
+def _prepare_validator(meta: Any) -> Callable:
+    """
+    Turn a parameter's validator into the callable run at call time.
+    Regex patterns (str or compiled) become a fullmatch over string values; with jit=True the
+    validator is compiled with numba.njit when numba is installed.
+    :param meta: Parameter source or metadata with a validator attribute.
+    :return: A callable taking the value and returning a truthy result when valid.
+    """
+    validator = meta.validator
+    if isinstance(validator, str):
+        validator = re.compile(validator)
+    if isinstance(validator, re.Pattern):
+        return validator.fullmatch
+    if getattr(meta, "jit", False):
+        return _jit_compile(validator)
+    return validator
+
+
+def _jit_compile(func: Callable, signature: Optional[str] = None) -> Callable:
+    """
+    Compile a function with numba.njit (cached on disk), keeping the Python function as fallback.
+    If numba is missing or cannot compile the function, the Python function is used from then on;
+    a compile failure (including an invalid signature) is reported with a RuntimeWarning.
+    :param func: Python function.
+    :param signature: Optional numba signature string; compiles eagerly when given.
+    :return: A callable with the same behaviour as func.
+    """
+    numba = _numba()
+    if numba is None:
+        return func
+    try:
+        if signature is None:
+            compiled = numba.njit(cache=True)(func)
+        else:
+            compiled = numba.njit(signature, cache=True)(func)
+    except (numba.core.errors.NumbaError, RuntimeError, TypeError, NameError) as e:
+        # RuntimeError: no on-disk cache locator; TypeError/NameError: unparsable signature
+        warnings.warn(
+            f"Cannot JIT-compile {getattr(func, '__name__', func)!r}, running it as Python: {e}",
+            RuntimeWarning,
+            stacklevel=2,
+        )
+        return func
+    current = [compiled]
+
+    @functools.wraps(func)
+    def run(*args, **kwargs):
+        try:
+            return current[0](*args, **kwargs)
+        except numba.core.errors.NumbaError:
+            current[0] = func
+            return func(*args, **kwargs)
+
+    run.dispatcher = compiled
+    return run
+
+
+def _apply_changes(state: Dict[str, Any], changes: Dict[str, Any]) -> None:
+    """
+    Apply one context log entry's changes to a context state in place.
+    :param state: Context dict to update.
+    :param changes: Dict of key to new value, or _DELETED for removed keys.
+    """
+    for key, value in changes.items():
+        if value is _DELETED:
+            state.pop(key, None)
+        else:
+            state[key] = value
+
+
+def _debug_write(msg: str) -> None:
+    """
+    Write a debug line to stdout in a single write call.
+    :param msg: The message, without the [DEBUG] prefix.
+    """
+    sys.stdout.write(f"[DEBUG] {msg}\n")
+
+
+def _invoke_stateful(
+    bridge: "Bridge",
+    cls: type,
+    key: str,
+    mname: str,
+    /,
+    *args,
+    instance_name: Optional[str] = None,
+    **kwargs,
+) -> Any:
+    """
+    Call a method on a stateful instance stored in the bridge context.
+    Bound with functools.partial for each method registered by Bridge.register_class.
+    :param bridge: The bridge holding the instance.
+    :param cls: The registered class.
+    :param key: Context key of the default instance.
+    :param mname: Name of the method to call.
+    :param instance_name: Optional name of the instance to use instead of the default one.
+    :return: The method's result.
+    :raises RuntimeError: If no instance is stored under the resolved key.
+    """
+    store_key = f"{key}:{instance_name}" if instance_name else key
+    instance = bridge.context.get(store_key)
+    if not instance:
+        raise RuntimeError(
+            f"No {cls.__name__} instance found in context for key '{store_key}'. Please create one first."
+        )
+    return getattr(instance, mname)(*args, **kwargs)
+
+
 class FunctionMetadata:
     """
     Metadata for a registered function, including parameter sources, output destinations, and validation.
     """
 
+    __slots__ = (
+        "func",
+        "name",
+        "description",
+        "_params",
+        "output",
+        "bridge",
+        "validate_and_call",
+        "_debug",
+        "_own_debug",
+        "_validators",
+        "_callable_defaults",
+        "_pre_hooks",
+        "_post_hooks",
+        "_error_hooks",
+        "_pydantic_model",
+        "_field_names",
+        "_required",
+        "_passthrough",
+        "_adapter",
+        "_batch_adapter",
+        "_call_target",
+        "_pydantic_validation",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         func: Callable,
@@ -30,6 +379,9 @@ class FunctionMetadata:
         params: Optional[Dict[str, Any]] = None,
         output: Any = None,
         debug: bool = False,
+        jit: bool = False,
+        jit_signature: Optional[str] = None,
+        validate_with_pydantic: bool = True,
     ):
         """
         Initialize FunctionMetadata for a registered function.
@@ -39,176 +391,385 @@ class FunctionMetadata:
         :param params: Parameter sources or metadata.
         :param output: Output destination or list of destinations.
         :param debug: Debug flag for logging.
+        :param jit: Execute a numba.njit compiled version of the function when numba is installed.
+        :param jit_signature: Optional numba signature string for eager compilation (requires jit).
+        :param validate_with_pydantic: If False, parameters are passed to the function as given, after custom validators.
         """
         self.func = func
-        self.name = name or func.__name__
+        self.bridge = None  # Set by Bridge.register
+        # Interned: the name is the key of bridge.functions and the CLI's command lookups
+        self.name = sys.intern(name or func.__name__)
         self.description = description or (
             func.__doc__.strip() if func.__doc__ else f"Execute {self.name}"
         )
-        self.debug = debug
+        self._debug = self._own_debug = bool(debug)
+        # Validation and metadata always use the original Python function
+        self._call_target = _jit_compile(func, jit_signature) if jit else func
+        self._pydantic_validation = bool(validate_with_pydantic)
+        sig = _signature(func)
         # Parameter extraction and metadata
         if params is not None:
-            self.params = {}
-            for pname, pval in params.items():
-                if hasattr(pval, "validator"):  # Check if it's ParameterMetadata
-                    self.params[pname] = pval
-                else:
-                    self.params[pname] = pval
+            # Interned names make the per-call dict lookups identity hits
+            params = {sys.intern(pname): pval for pname, pval in params.items()}
         else:
-            self.params = {}
-            sig = inspect.signature(func)
+            params = {}
             for pname, param in sig.parameters.items():
                 annotation = (
                     param.annotation
                     if param.annotation != inspect.Parameter.empty
                     else None
                 )
-                for source_cls in ParamSource.__subclasses__():
-                    if source_cls.supports(annotation, param):
-                        meta = None
-                        if hasattr(param, "metadata") and param.metadata:
-                            meta = param.metadata
-                        self.params[pname] = source_cls.from_param(
-                            annotation, param, meta
-                        )
-                        break
+                source_cls = ParamSource.resolve(annotation, param)
+                if source_cls is not None:
+                    meta = None
+                    if hasattr(param, "metadata") and param.metadata:
+                        meta = param.metadata
+                    params[pname] = source_cls.from_param(annotation, param, meta)
+        self.params = params
         # Output destinations
         if output is None:
             self.output = []
-        elif hasattr(output, "__iter__") and not hasattr(
-            output, "strip"
-        ):  # Check if it's a list-like object
-            self.output = output
-        else:
+        elif isinstance(output, (list, tuple)):
+            self.output = list(output)
+        elif isinstance(output, str) or not hasattr(output, "__iter__"):
             self.output = [output]
-        self.pydantic_model = self._make_pydantic_model(func)
+        else:
+            self.output = list(output)
+        # Hook tuples are bound by the bridge on registration
+        self._pre_hooks = ()
+        self._post_hooks = ()
+        self._error_hooks = ()
+        self._pydantic_model = None
+        self._field_names = tuple(sig.parameters)
+        self._required = frozenset(
+            pname
+            for pname, param in sig.parameters.items()
+            if param.default is inspect.Parameter.empty
+        )
+        self._passthrough = _passthrough_types(sig)
+        self._adapter = _UNBUILT
+        self._batch_adapter = _UNBUILT
+        # Pre-bound alias of __call__, so callers skip descriptor binding per call
+        self.validate_and_call = self.__call__
 
-    def _make_pydantic_model(self, func: Callable) -> BaseModel:
+    @property
+    def params(self) -> Dict[str, Any]:
         """
-        Create a Pydantic model for parameter validation based on the function signature.
-        :param func: The function to create a model for.
-        :return: A dynamically created Pydantic model class.
+        Parameter sources or metadata by parameter name.
+        Validators and callable defaults are collected when params is assigned; call refresh_params
+        after changing a parameter's validator or default in place.
         """
-        sig = inspect.signature(func)
-        fields = {}
-        for name, param in sig.parameters.items():
-            annotation = (
-                param.annotation if param.annotation != inspect.Parameter.empty else str
-            )
-            default = param.default if param.default != inspect.Parameter.empty else ...
-            fields[name] = (annotation, default)
-        return create_model(f"{func.__name__}Model", **fields)
+        return self._params
+
+    @params.setter
+    def params(self, params: Dict[str, Any]) -> None:
+        self._params = params
+        self.refresh_params()
+
+    def refresh_params(self) -> None:
+        """
+        Re-collect the validators and callable defaults checked at call time from params.
+        """
+        # Only parameters with a custom validator are checked at call time
+        self._validators = tuple(
+            (pname, getattr(meta, "default", None), _prepare_validator(meta))
+            for pname, meta in self._params.items()
+            if getattr(meta, "validator", None)
+        )
+        # Parameters whose default must be computed at call time
+        self._callable_defaults = tuple(
+            (pname, meta.default)
+            for pname, meta in self._params.items()
+            if callable(getattr(meta, "default", None))
+        )
+
+    @property
+    def debug(self) -> bool:
+        """
+        Debug flag for this function. Debug output is also enabled by the owning bridge's flag.
+        """
+        return self._own_debug
+
+    @debug.setter
+    def debug(self, value: bool) -> None:
+        self._own_debug = bool(value)
+        self._debug = self._own_debug or bool(self.bridge and self.bridge.debug)
+
+    @property
+    def pydantic_model(self) -> BaseModel:
+        """
+        Pydantic model for the function parameters, created on first access.
+        """
+        if self._pydantic_model is None:
+            self._pydantic_model = _build_model(self.func)
+        return self._pydantic_model
 
     def __call__(self, params: dict) -> Any:
         """
         Validate and coerce parameters using the Pydantic model, then call the function.
         Calls pre, post, and error hooks as registered on the bridge.
+        Stages with nothing to do for this function are skipped.
         :param params: Dictionary of raw parameter values.
         :return: Result of the function call with validated parameters.
         :raises BridgeValidationError: If parameter validation fails.
         :raises BridgeExecutionError: If function execution fails.
         """
-        bridge = getattr(self, "bridge", None)
-        self._debug_print_call(params, bridge)
-        self._run_pre_hooks(params, bridge)
-        self._resolve_callable_defaults(params)
-        self._run_param_validators(params)
-        validated = self._validate_params(params, bridge)
-        result = self._execute_function(validated, bridge)
-        self._handle_output_destinations(result, bridge)
-        self._run_post_hooks(result, bridge)
+        if self._debug:
+            self._debug_print_call(params)
+        if self._pre_hooks:
+            self._run_pre_hooks(params)
+        if self._callable_defaults:
+            self._resolve_callable_defaults(params)
+        if self._validators:
+            self._run_param_validators(params)
+        if self._pydantic_validation:
+            params = self._validate_params(params)
+        return self._finish_call(params)
+
+    def validate_and_call_json(self, raw: Union[str, bytes]) -> Any:
+        """
+        Parse and validate a JSON object of parameters in a single Pydantic pass, then call the function.
+        Falls back to json.loads and __call__ when pre-hooks, callable defaults, or custom validators need the dict,
+        or when Pydantic validation is disabled.
+        :param raw: JSON object text or bytes.
+        :return: Result of the function call with validated parameters.
+        :raises BridgeValidationError: If the JSON or parameter validation fails.
+        :raises BridgeExecutionError: If function execution fails.
+        """
+        if (
+            self._pre_hooks
+            or self._callable_defaults
+            or self._validators
+            or not self._pydantic_validation
+        ):
+            try:
+                params = json.loads(raw)
+            except ValueError as e:
+                raise BridgeValidationError(
+                    f"Invalid JSON parameters for function '{self.name}': {e}"
+                ) from e
+            if not isinstance(params, dict):
+                raise BridgeValidationError(
+                    f"Invalid JSON parameters for function '{self.name}': expected a JSON object"
+                )
+            return self(params)
+        if self._debug:
+            self._debug_print_call(raw)
+        adapter = self._get_adapter()
+        try:
+            if adapter is not None:
+                validated = adapter.validate_json(raw)
+            else:
+                model = self.pydantic_model.model_validate_json(raw)
+                validated = {name: getattr(model, name) for name in self._field_names}
+        except (ValidationError, PydanticUserError) as e:
+            self._validation_failed(e)
+        return self._finish_call(validated)
+
+    def validate_and_call_many(self, list_of_params: List[dict]) -> List[Any]:
+        """
+        Validate a batch of parameter dicts in a single Pydantic pass, then call the function once per row.
+        Pre hooks run once with the whole list and post hooks once with the list of results;
+        callable defaults, custom validators, and output destinations still apply to every row.
+        :param list_of_params: List of dictionaries of raw parameter values.
+        :return: List of results, in the same order as the inputs.
+        :raises BridgeValidationError: If validation of any row fails; no row is executed.
+        :raises BridgeExecutionError: If function execution fails.
+        """
+        if self._debug:
+            self._debug_print_call(list_of_params)
+        if self._pre_hooks:
+            self._run_pre_hooks(list_of_params)
+        if self._callable_defaults or self._validators:
+            for params in list_of_params:
+                if self._callable_defaults:
+                    self._resolve_callable_defaults(params)
+                if self._validators:
+                    self._run_param_validators(params)
+        if self._pydantic_validation:
+            validated_rows = self._validate_many(list_of_params)
+        else:
+            validated_rows = list_of_params
+        results = []
+        for validated in validated_rows:
+            result = self._execute_function(validated)
+            if self.output:
+                self._handle_output_destinations(result, self.bridge)
+            results.append(result)
+        if self._post_hooks:
+            self._run_post_hooks(results)
+        return results
+
+    def _validate_many(self, list_of_params):
+        """
+        Validate a batch of parameter dicts with the batch adapter, raising BridgeValidationError on failure.
+        Falls back to per-row validation when no adapter could be built.
+        :param list_of_params: List of parameter dicts.
+        :return: List of dicts of validated keyword arguments.
+        :raises BridgeValidationError: If validation of any row fails.
+        """
+        batch_adapter = self._batch_adapter
+        if batch_adapter is _UNBUILT:
+            batch_adapter = self._batch_adapter = _build_batch_adapter(self.func)
+        if batch_adapter is None:
+            return [self._validate_params(params) for params in list_of_params]
+        try:
+            return batch_adapter.validate_python(list_of_params)
+        except ValidationError as e:
+            self._validation_failed(e)
+
+    def _finish_call(self, validated):
+        """
+        Execute the function with validated parameters, then run output destinations and post hooks.
+        :param validated: Dict of validated keyword arguments.
+        :return: The result of the function call.
+        """
+        result = self._execute_function(validated)
+        if self.output:
+            self._handle_output_destinations(result, self.bridge)
+        if self._post_hooks:
+            self._run_post_hooks(result)
         return result
 
-    def _debug_print_call(self, params, bridge):
+    def precompile(self, *arg_types) -> bool:
         """
-        Print debug information about the function call if debug is enabled.
+        Compile the JIT version of the function for the given argument types ahead of the first call.
+        :param arg_types: numba types for the positional arguments, e.g. numba.int64.
+        :return: True if compiled, False if the function is not JIT-compiled or numba cannot compile it.
+        """
+        dispatcher = getattr(self._call_target, "dispatcher", None)
+        if dispatcher is None:
+            return False
+        try:
+            dispatcher.compile(tuple(arg_types))
+        except (_numba().core.errors.NumbaError, RuntimeError):
+            # RuntimeError: the dispatcher was built from an explicit signature and accepts no new ones
+            return False
+        return True
+
+    def _debug_print_call(self, params):
+        """
+        Print debug information about the function call. Only called when debug is enabled.
         :param params: Parameters passed to the function.
-        :param bridge: The bridge instance (may be None).
         """
-        if getattr(self, "debug", False) or (
-            bridge and getattr(bridge, "debug", False)
-        ):
-            print(f"[DEBUG] Calling {self.name} with params: {params}")
+        _debug_write(f"Calling {self.name} with params: {params}")
 
-    def _run_pre_hooks(self, params, bridge):
+    def _run_pre_hooks(self, params):
         """
         Run all registered pre-execution hooks before function execution.
         :param params: Parameters passed to the function.
-        :param bridge: The bridge instance (may be None).
         """
-        if bridge and hasattr(bridge, "_pre_hooks"):
-            for hook in bridge._pre_hooks:
-                hook(params, self)
+        for hook in self._pre_hooks:
+            hook(params, self)
 
     def _resolve_callable_defaults(self, params):
         """
         Resolve any callable defaults for missing parameters before validation.
         :param params: Parameters passed to the function.
         """
-        for pname, meta in getattr(self, "params", {}).items():
-            if pname not in params or params[pname] is None:
-                default = getattr(meta, "default", None)
-                if callable(default):
-                    params[pname] = default()
+        for pname, default in self._callable_defaults:
+            # Missing and None are treated alike, so one lookup covers both
+            if params.get(pname) is None:
+                params[pname] = default()
 
     def _run_param_validators(self, params):
         """
         Run custom per-parameter validators, raising BridgeValidationError on failure.
+        A single exception handler covers the whole loop.
         :param params: Parameters passed to the function.
         """
-        for pname, meta in getattr(self, "params", {}).items():
-            if hasattr(meta, "validator") and meta.validator:
-                value = params.get(pname, meta.default)
-                try:
-                    if not meta.validator(value):
-                        raise BridgeValidationError(
-                            f"Validation failed for parameter '{pname}': value={value} (custom validator returned False)"
-                        )
-                except Exception as e:
-                    raise BridgeValidationError(
-                        f"Validation error for parameter '{pname}': value={value} ({e})"
-                    )
-
-    def _validate_params(self, params, bridge):
-        """
-        Validate and coerce parameters using the Pydantic model, raising BridgeValidationError on failure.
+        pname = value = None
+        try:
+            for pname, default, validator in self._validators:
+                value = params.get(pname, default)
+                if not validator(value):
+                    break
+            else:
+                return
+        except Exception as e:
+            raise BridgeValidationError(
+                f"Validation error for parameter '{pname}': value={value} ({e})"
+            ) from e
+        raise BridgeValidationError(
+            f"Validation failed for parameter '{pname}': value={value} (custom validator returned False)"
+        )
+
+    def _validate_params(self, params):
+        """
+        Validate and coerce parameters using the Pydantic adapter, raising BridgeValidationError on failure.
+        Falls back to the Pydantic model when no adapter could be built.
+        The model is built on first use, so an annotation Pydantic cannot handle is reported here.
         :param params: Parameters passed to the function.
-        :param bridge: The bridge instance (may be None).
-        :return: Validated Pydantic model instance.
-        :raises BridgeValidationError: If validation fails.
+        :return: Dict of validated keyword arguments.
+        :raises BridgeValidationError: If validation fails or no validator can be built for the annotations.
         """
+        if self._passthrough is not None:
+            kwargs = self._passthrough_params(params)
+            if kwargs is not None:
+                return kwargs
+        adapter = self._get_adapter()
         try:
-            return self.pydantic_model(**params)
-        except ValidationError as e:
-            if bridge and hasattr(bridge, "_error_hooks"):
-                for hook in bridge._error_hooks:
-                    hook(e, self)
-            msg = f"Parameter validation failed for function '{self.name}': {e}"
-            if getattr(self, "debug", False) or (
-                bridge and getattr(bridge, "debug", False)
-            ):
-                print(f"[DEBUG] {msg}")
-            raise BridgeValidationError(msg) from e
-
-    def _execute_function(self, validated, bridge):
+            if adapter is not None:
+                return adapter.validate_python(params)
+            validated = self.pydantic_model.model_validate(params)
+            return {name: getattr(validated, name) for name in self._field_names}
+        except (ValidationError, PydanticUserError) as e:
+            self._validation_failed(e)
+
+    def _get_adapter(self) -> Optional[TypeAdapter]:
+        """
+        Return the parameter adapter, building it on first use.
+        """
+        adapter = self._adapter
+        if adapter is _UNBUILT:
+            adapter = self._adapter = _build_adapter(self.func)
+        return adapter
+
+    def _validation_failed(self, error: Union[ValidationError, PydanticUserError]):
+        """
+        Run error hooks for a Pydantic validation or schema error and raise it as BridgeValidationError.
+        :param error: The Pydantic error.
+        :raises BridgeValidationError: Always.
+        """
+        for hook in self._error_hooks:
+            hook(error, self)
+        msg = f"Parameter validation failed for function '{self.name}': {error}"
+        if self._debug:
+            _debug_write(msg)
+        raise BridgeValidationError(msg) from error
+
+    def _passthrough_params(self, params):
+        """
+        Return the function's keyword arguments directly when every value already has its declared type.
+        :param params: Parameters passed to the function.
+        :return: Dict of keyword arguments, or None if Pydantic must validate or report an error.
+        """
+        kwargs = {}
+        for pname, expected in self._passthrough.items():
+            if pname in params:
+                value = params[pname]
+                if expected is not Any and type(value) is not expected:
+                    return None
+                kwargs[pname] = value
+            elif pname in self._required:
+                return None
+        return kwargs
+
+    def _execute_function(self, validated):
         """
         Call the registered function with validated parameters, handling errors and hooks.
-        :param validated: Validated Pydantic model instance.
-        :param bridge: The bridge instance (may be None).
+        :param validated: Dict of validated keyword arguments.
         :return: The result of the function call.
         :raises BridgeExecutionError: If function execution fails.
         """
         try:
-            return self.func(**validated.model_dump())
+            return self._call_target(**validated)
         except Exception as e:
-            if bridge and hasattr(bridge, "_error_hooks"):
-                for hook in bridge._error_hooks:
-                    hook(e, self)
+            for hook in self._error_hooks:
+                hook(e, self)
             msg = f"Execution failed for function '{self.name}': {e}"
-            if getattr(self, "debug", False) or (
-                bridge and getattr(bridge, "debug", False)
-            ):
-                print(f"[DEBUG] {msg}")
+            if self._debug:
+                _debug_write(msg)
             raise BridgeExecutionError(msg) from e
 
     def _handle_output_destinations(self, result, bridge):
@@ -217,22 +778,19 @@ class FunctionMetadata:
         :param result: The result of the function call.
         :param bridge: The bridge instance (may be None).
         """
-        if bridge and hasattr(self, "output"):
+        if bridge and self.output:
             for dest in self.output:
-                if hasattr(dest, "send") and callable(getattr(dest, "send")):
-                    dest.send(result, bridge)
+                send = getattr(dest, "send", None)
+                if callable(send):
+                    send(result, bridge)
 
-    def _run_post_hooks(self, result, bridge):
+    def _run_post_hooks(self, result):
         """
         Run all registered post-execution hooks after function execution.
         :param result: The result of the function call.
-        :param bridge: The bridge instance (may be None).
         """
-        if bridge and hasattr(bridge, "_post_hooks"):
-            for hook in bridge._post_hooks:
-                hook(result, self)
-
-    validate_and_call = __call__
+        for hook in self._post_hooks:
+            hook(result, self)
 
 
 class Bridge:
@@ -240,6 +798,21 @@ class Bridge:
     Core bridge class for registering functions, managing context, and event hooks.
     """
 
+    __slots__ = (
+        "name",
+        "version",
+        "functions",
+        "context",
+        "_context_log",
+        "_logged_context",
+        "_pre_hooks",
+        "_post_hooks",
+        "_error_hooks",
+        "_debug",
+        "_func_names",
+        "__weakref__",
+    )
+
     def __init__(self, name: str, version: str = "1.0.0", debug: bool = False):
         """
         :param name: Name of the bridge.
@@ -250,23 +823,85 @@ class Bridge:
         self.version = version
         self.functions: Dict[str, FunctionMetadata] = {}
         self.context: Dict[str, Any] = {}
-        self.context_history: List[Dict[str, Any]] = [copy.deepcopy(self.context)]
-        self._pre_hooks: List[Callable] = []
-        self._post_hooks: List[Callable] = []
-        self._error_hooks: List[Callable] = []
-        self.debug = debug
+        # One (restored_index, changes) entry per history step; snapshots are rebuilt on request
+        self._context_log: List[Tuple[Optional[int], Dict[str, Any]]] = []
+        # The live context values as of the last log entry, to detect direct writes to context
+        self._logged_context: Dict[str, Any] = {}
+        # Hooks are immutable tuples, replaced (and re-bound to functions) when added
+        self._pre_hooks: Tuple[Callable, ...] = ()
+        self._post_hooks: Tuple[Callable, ...] = ()
+        self._error_hooks: Tuple[Callable, ...] = ()
+        self._debug = bool(debug)
+        # Case-folded name -> function name, rebuilt after registrations
+        self._func_names: Optional[Dict[str, str]] = None
+
+    @property
+    def debug(self) -> bool:
+        """
+        Debug flag for all functions registered on this bridge.
+        """
+        return self._debug
+
+    @debug.setter
+    def debug(self, value: bool) -> None:
+        self._debug = bool(value)
+        for metadata in self.functions.values():
+            metadata._debug = metadata._own_debug or self._debug
+
+    @property
+    def _func_name_map(self) -> Dict[str, str]:
+        """
+        Case-insensitive (case-folded) function name lookup, built on first use after a registration.
+        """
+        if self._func_names is None:
+            self._func_names = {
+                sys.intern(fname.casefold()): fname for fname in self.functions
+            }
+        return self._func_names
+
+    def lookup(self, name: str) -> Optional[str]:
+        """
+        Find a registered function by name, ignoring case.
+        Functions added directly to bridge.functions are found too; the name map is rebuilt when they are.
+        :param name: The function name in any case.
+        :return: The key of the function in bridge.functions, or None if there is none.
+        """
+        # ASCII lower-case names (the usual case) are already case-folded
+        folded = name if name.isascii() and name.islower() else name.casefold()
+        fname = self._func_name_map.get(folded)
+        if fname is not None and fname in self.functions:
+            return fname
+        for fname in self.functions:
+            if fname.casefold() == folded:
+                self._func_names = None
+                return fname
+        return None
 
     def add_pre_hook(self, hook: Callable) -> None:
         """Register a pre-execution hook. Called with (params, meta) before function execution."""
-        self._pre_hooks.append(hook)
+        self._pre_hooks += (hook,)
+        self._bind_hooks_all()
 
     def add_post_hook(self, hook: Callable) -> None:
         """Register a post-execution hook. Called with (result, meta) after function execution."""
-        self._post_hooks.append(hook)
+        self._post_hooks += (hook,)
+        self._bind_hooks_all()
 
     def add_error_hook(self, hook: Callable) -> None:
         """Register an error hook. Called with (exception, meta) if an error occurs."""
-        self._error_hooks.append(hook)
+        self._error_hooks += (hook,)
+        self._bind_hooks_all()
+
+    def _bind_hooks(self, metadata: FunctionMetadata) -> None:
+        """Share the current hook tuples with a registered function."""
+        metadata._pre_hooks = self._pre_hooks
+        metadata._post_hooks = self._post_hooks
+        metadata._error_hooks = self._error_hooks
+
+    def _bind_hooks_all(self) -> None:
+        """Re-bind the hook tuples on every registered function after a hook is added."""
+        for metadata in self.functions.values():
+            self._bind_hooks(metadata)
 
     def register(
         self,
@@ -275,6 +910,9 @@ class Bridge:
         description: Optional[str] = None,
         params: Optional[Dict[str, Any]] = None,
         output: Any = None,
+        jit: bool = False,
+        signature: Optional[str] = None,
+        validate_with_pydantic: bool = True,
     ) -> FunctionMetadata:
         """
         Register a function with the bridge.
@@ -283,44 +921,129 @@ class Bridge:
         :param description: Optional description.
         :param params: Optional parameter sources or metadata.
         :param output: Optional output destination(s).
+        :param jit: Execute the function through numba.njit when numba is installed, falling back to Python if it cannot compile.
+        :param signature: Optional numba signature string for eager compilation (requires jit).
+        :param validate_with_pydantic: If False, skip Pydantic validation and pass parameters through as given
+            (custom validators still run). The Pydantic model is then never built.
         :return: FunctionMetadata instance.
+
+        JIT functions are compiled with cache=True, so later processes reuse the on-disk cache.
+        Without a signature compilation is lazy and happens on the first call, so functions that are
+        never called cost nothing at startup. With a signature the function compiles immediately at
+        registration, which moves the cost to startup for latency-critical functions.
+        FunctionMetadata.precompile warms a lazy function without a throwaway call.
         """
-        metadata = FunctionMetadata(func, name, description, params, output)
+        metadata = FunctionMetadata(
+            func,
+            name,
+            description,
+            params,
+            output,
+            jit=jit,
+            jit_signature=signature,
+            validate_with_pydantic=validate_with_pydantic,
+        )
         metadata.bridge = self  # Attach bridge reference for hooks
+        self._bind_hooks(metadata)
+        metadata._debug = metadata._own_debug or self._debug
         self.functions[metadata.name] = metadata
+        self._func_names = None
         return metadata
 
     def update_context(self, key: str, value: Any) -> None:
         """
-        Update the context and snapshot the new state in history.
+        Update the context and record the change in history.
+        Direct writes and deletes on context since the last entry are recorded in the same entry.
+        Only changed values are deep-copied into the log, so later in-place mutation does not alter history.
         """
         self.context[key] = value
-        self.context_history.append(copy.deepcopy(self.context))
+        self._context_log.append((None, self._context_changes()))
+        self._logged_context = dict(self.context)
+
+    def _context_changes(self) -> Dict[str, Any]:
+        """
+        Diff the live context against the last logged state.
+        Values are compared by identity; deleted keys map to _DELETED.
+        :return: Dict of key to a copy of its new value, in context order.
+        """
+        logged = self._logged_context
+        changes = {
+            key: copy.deepcopy(value)
+            for key, value in self.context.items()
+            if key not in logged or logged[key] is not value
+        }
+        for key in logged:
+            if key not in self.context:
+                changes[key] = _DELETED
+        return changes
 
     def clear_context(self) -> None:
         """
         Clear the context and reset history.
         """
         self.context.clear()
-        self.context_history = [copy.deepcopy(self.context)]
+        self._context_log = []
+        self._logged_context = {}
 
     def restore_context(self, index: int) -> None:
         """
         Restore the context to a previous state from history.
+        The restore is logged as a reference to that index, not as a copy of the context.
+        The restored values are copies, so mutating them leaves the history intact.
         :param index: Index in the context history list.
         """
-        if 0 <= index < len(self.context_history):
-            self.context = copy.deepcopy(self.context_history[index])
-            self.context_history.append(copy.deepcopy(self.context))
+        if 0 <= index <= len(self._context_log):
+            self.context = copy.deepcopy(self._snapshot(index))
+            self._context_log.append((index, {}))
+            self._logged_context = dict(self.context)
         else:
             raise IndexError("Invalid context history index.")
 
-    def get_context_history(self) -> List[Dict[str, Any]]:
+    def _snapshot(self, index: int) -> Dict[str, Any]:
+        """
+        Rebuild the context as it was at the given history index by replaying the log.
+        Restore entries are followed back to the state they refer to.
+        :param index: Index in the context history list.
+        :return: A new context dict.
+        """
+        log = self._context_log
+        segments = []
+        while True:
+            start = index
+            while start > 0 and log[start - 1][0] is None:
+                start -= 1
+            segments.append((start, index))
+            if start == 0:
+                break
+            index = log[start - 1][0]
+        state: Dict[str, Any] = {}
+        for start, end in reversed(segments):
+            for _, changes in log[start:end]:
+                _apply_changes(state, changes)
+        return state
+
+    def get_context_history(self) -> Tuple[Mapping[str, Any], ...]:
+        """
+        Get the context history snapshots, rebuilt from the change log.
+        Snapshots are read-only views and the sequence is a tuple, so callers need not copy them defensively.
+        :return: Tuple of read-only context mappings.
+        """
+        history: List[Mapping[str, Any]] = [MappingProxyType({})]
+        state: Dict[str, Any] = {}
+        for restored, changes in self._context_log:
+            if restored is not None:
+                state = dict(history[restored])
+            else:
+                _apply_changes(state, changes)
+            history.append(MappingProxyType(state.copy()))
+        return tuple(history)
+
+    @property
+    def context_history(self) -> Tuple[Mapping[str, Any], ...]:
         """
-        Get the list of context history snapshots.
-        :return: List of context dicts.
+        Context history snapshots (see get_context_history).
         """
-        return self.context_history
+        return self.get_context_history()
 
     def register_class(
         self,
@@ -364,7 +1087,6 @@ class Bridge:
 
     def _register_stateful_constructor(self, cls, params, output, key):
         """Register a constructor function that creates and stores the instance in context, supporting multiple named instances."""
-        import inspect
 
         def make_and_store_instance(*args, instance_name: str = None, **kwargs):
             instance = cls(*args, **kwargs)
@@ -373,7 +1095,7 @@ class Bridge:
             return instance
 
         # Use the signature from __init__, excluding 'self'
-        sig = inspect.signature(cls.__init__)
+        sig = _signature(cls.__init__)
         params_list = list(sig.parameters.values())
         if params_list and params_list[0].name == "self":
             params_list = params_list[1:]
@@ -396,43 +1118,31 @@ class Bridge:
 
     def _register_stateful_methods(self, cls, methods, key):
         """Register instance methods that operate on the stored instance in context, supporting multiple named instances."""
-        import inspect
-
         for method in methods or []:
             method_name = method["name"]
 
-            def make_method_func(mname):
-                method_obj = getattr(cls, mname)
-                sig = inspect.signature(method_obj)
-                # Remove 'self' from the signature
-                params = list(sig.parameters.values())
-                if params and params[0].name == "self":
-                    params = params[1:]
-                # Add instance_name as a keyword-only parameter
-                params.append(
-                    inspect.Parameter(
-                        "instance_name",
-                        inspect.Parameter.KEYWORD_ONLY,
-                        default=None,
-                        annotation=str,
-                    )
+            sig = _signature(getattr(cls, method_name))
+            # Remove 'self' from the signature
+            params = list(sig.parameters.values())
+            if params and params[0].name == "self":
+                params = params[1:]
+            # Add instance_name as a keyword-only parameter
+            params.append(
+                inspect.Parameter(
+                    "instance_name",
+                    inspect.Parameter.KEYWORD_ONLY,
+                    default=None,
+                    annotation=str,
                 )
-                new_sig = inspect.Signature(params)
-
-                def method_func(*args, instance_name: str = None, **kwargs):
-                    store_key = f"{key}:{instance_name}" if instance_name else key
-                    instance = self.context.get(store_key)
-                    if not instance:
-                        raise RuntimeError(
-                            f"No {cls.__name__} instance found in context for key '{store_key}'. Please create one first."
-                        )
-                    return getattr(instance, mname)(*args, **kwargs)
-
-                method_func.__signature__ = new_sig
-                return method_func
-
+            )
+            method_func = functools.partial(
+                _invoke_stateful, self, cls, key, method_name
+            )
+            method_func.__signature__ = inspect.Signature(params)
+            method_func.__name__ = method_name
+            method_func.__doc__ = None
             self.register(
-                make_method_func(method_name),
+                method_func,
                 name=f"{cls.__name__}.{method_name}",
                 description=method.get("description"),
                 params=method.get("params"),
@@ -443,15 +1153,14 @@ class Bridge:
         """
         Return a dictionary mapping each registered stateful class name to a list of all instance names (or keys) currently stored in context for that class.
         Example: { 'Counter': ['default', 'mycounter', ...], ... }
+        The listing is derived from the current context, so direct writes to bridge.context are included.
         """
-        from collections import defaultdict
-
-        result = defaultdict(list)
+        result: Dict[str, List[str]] = {}
         for key in self.context:
-            if "_instance" in key:
+            if isinstance(key, str) and "_instance" in key:
                 # e.g., key = 'Counter_instance' or 'Counter_instance:myname'
-                base, *rest = key.split(":", 1)
-                class_part = base.replace("_instance", "")
-                instance_name = rest[0] if rest else "default"
-                result[class_part].append(instance_name)
-        return dict(result)
+                base, sep, instance_name = key.partition(":")
+                result.setdefault(base.replace("_instance", ""), []).append(
+                    instance_name if sep else "default"
+                )
+        return result
@@ -3,18 +3,179 @@ bridges.core.types
 Minimal concrete parameter and output types for bridges core.
 """
 
+import functools
 import inspect
+import warnings
 from abc import ABC
-from typing import Any, List, Optional, Type
+from enum import Enum
+from typing import (
+    IO,
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    get_args,
+    get_origin,
+)
 
 from .base import OutputDestination, ParamSource
 
 
+@functools.lru_cache(maxsize=256)
+def _enum_options(enum_cls: type) -> Tuple[Tuple[str, Any], ...]:
+    """
+    Build the (label, value) menu options for an Enum class once.
+    :param enum_cls: The Enum class.
+    :return: Tuple of (member name, member) tuples.
+    """
+    return tuple((member.name, member) for member in enum_cls)
+
+
+# Minimum number of separators before numeric list input is parsed with NumPy
+_NUMPY_MIN_ITEMS = 64
+
+
+@functools.lru_cache(maxsize=None)
+def _numpy():
+    """
+    Import NumPy on first use; it is optional and only used for large numeric list input.
+    :return: The numpy module, or None if it is not installed.
+    """
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _parse_numeric_list(raw: str, separator: str, element_type: type) -> Optional[list]:
+    """
+    Parse separator-delimited int or float values in one NumPy pass.
+    :param raw: The raw input string.
+    :param separator: Separator between values.
+    :param element_type: int or float.
+    :return: List of Python numbers, or None if NumPy is unavailable or the input needs the Python parser.
+    """
+    np = _numpy()
+    if np is None:
+        return None
+    dtype = np.int64 if element_type is int else np.float64
+    try:
+        with warnings.catch_warnings():
+            # Older NumPy only warns (and truncates) on malformed input
+            warnings.simplefilter("error", DeprecationWarning)
+            values = np.fromstring(raw, dtype=dtype, sep=separator)
+    except (ValueError, DeprecationWarning):
+        return None
+    if len(values) != raw.count(separator) + 1:
+        return None
+    if dtype is np.int64:
+        limits = np.iinfo(np.int64)
+        # Out-of-range integers are clipped by NumPy; let Python parse them exactly
+        if values.max() == limits.max or values.min() == limits.min:
+            return None
+    return values.tolist()
+
+
+def _option_index(options: Tuple[Tuple[str, Any], ...], value: Any) -> Optional[int]:
+    """
+    Return the position of the first (label, value) option holding value.
+    :param options: Normalized menu options.
+    :param value: The value to find; None never matches.
+    :return: The index, or None if not found.
+    """
+    if value is None:
+        return None
+    return next((i for i, (_, v) in enumerate(options) if v == value), None)
+
+
+# Read buffer size for streamed file parameters
+_STREAM_BUFFER_SIZE = 1 << 20
+
+
+def _metadata_fields(metadata: Optional[Any]) -> Tuple[Optional[str], Optional[Any]]:
+    """
+    Return the (description, validator) pair of a parameter's metadata.
+    ParameterMetadata is read directly; other objects are probed with getattr.
+    :param metadata: ParameterMetadata, any object with those attributes, or None.
+    """
+    if isinstance(metadata, ParameterMetadata):
+        return metadata.description, metadata.validator
+    if not metadata:
+        return None, None
+    return getattr(metadata, "description", None), getattr(metadata, "validator", None)
+
+
 class ParamSource(ABC):
     """
     Base class for parameter sources. Subclasses should implement supports and from_param for extensible parameter handling.
     """
 
+    # Instance attributes are declared per subclass; weak references are kept by interfaces
+    __slots__ = ("__weakref__",)
+
+    # Kind of input this source collects ("input", "menu", "list", "file", "context"); read by interfaces
+    kind: Optional[str] = None
+
+    # Type label shown by interfaces; subclasses get their class name without the "ParamSource" suffix
+    _display_type_name: str = ""
+
+    # Catch-all sources (supports() always True) are tried after every specific source
+    _catch_all: bool = False
+
+    # Direct subclasses and (annotation, name, kind) -> source class results used by resolve()
+    _dispatch_classes: Optional[Tuple[Type["ParamSource"], ...]] = None
+    _dispatch_cache: Dict[Any, Optional[Type["ParamSource"]]] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "_display_type_name" not in cls.__dict__:
+            cls._display_type_name = cls.__name__.replace("ParamSource", "")
+        ParamSource.invalidate_dispatch_cache()
+
+    @classmethod
+    def invalidate_dispatch_cache(cls) -> None:
+        """
+        Drop cached dispatch results so newly defined sources are considered by resolve.
+        """
+        ParamSource._dispatch_classes = None
+        ParamSource._dispatch_cache = {}
+
+    @classmethod
+    def resolve(
+        cls, annotation: Any, param: inspect.Parameter
+    ) -> Optional[Type["ParamSource"]]:
+        """
+        Return the first direct ParamSource subclass that supports the annotation; catch-all sources are tried last.
+        Results are cached per annotation, parameter name, and kind, since supports() may look at the parameter;
+        unhashable annotations are resolved each time.
+        :param annotation: The type annotation of the parameter.
+        :param param: The inspect.Parameter object.
+        """
+        cache = ParamSource._dispatch_cache
+        key = (annotation, param.name, param.kind)
+        try:
+            return cache[key]
+        except (KeyError, TypeError):
+            pass
+        if ParamSource._dispatch_classes is None:
+            # Stable sort: definition order, with catch-all sources moved last
+            ParamSource._dispatch_classes = tuple(
+                sorted(ParamSource.__subclasses__(), key=lambda c: c._catch_all)
+            )
+        source_cls = None
+        for candidate in ParamSource._dispatch_classes:
+            if candidate.supports(annotation, param):
+                source_cls = candidate
+                break
+        try:
+            cache[key] = source_cls
+        except TypeError:
+            pass
+        return source_cls
+
     @classmethod
     def supports(
         cls: Type["ParamSource"], annotation: Any, param: inspect.Parameter
@@ -47,6 +208,10 @@ class InputParamSource(ParamSource):
     Parameter source for direct user input.
     """
 
+    kind = "input"
+    _catch_all = True
+    __slots__ = ("default", "placeholder", "description", "validator")
+
     def __init__(
         self,
         default: Any = None,
@@ -85,8 +250,7 @@ class InputParamSource(ParamSource):
         Create an InputParamSource from a parameter.
         """
         default = param.default if param.default != inspect.Parameter.empty else None
-        description = getattr(metadata, "description", None) if metadata else None
-        validator = getattr(metadata, "validator", None) if metadata else None
+        description, validator = _metadata_fields(metadata)
         return cls(default=default, description=description, validator=validator)
 
 
@@ -95,6 +259,16 @@ class MenuParamSource(ParamSource):
     Parameter source for menu/option selection.
     """
 
+    kind = "menu"
+    __slots__ = (
+        "_options",
+        "_default",
+        "description",
+        "validator",
+        "_choices",
+        "_default_index",
+    )
+
     def __init__(
         self,
         options: list,
@@ -108,21 +282,55 @@ class MenuParamSource(ParamSource):
         :param description: Description for the parameter.
         :param validator: Callable for custom validation (value -> bool or raises).
         """
-        self.options: list = self._normalize_options(options)
-        self.default: Any = default
+        self._default: Any = default
+        # Also sets the cached prompt choices and default index
+        self.options = options
         self.description: Optional[str] = description
         self.validator: Optional[Any] = validator
 
-    def _normalize_options(self, options):
-        """Normalize options to (label, value) tuples."""
-        normalized = []
-        for option in options:
-            if hasattr(option, "__len__") and len(option) == 2:
-                label, value = option
-            else:
-                label, value = str(option), option
-            normalized.append((label, value))
-        return normalized
+    @property
+    def options(self) -> Tuple[Tuple[str, Any], ...]:
+        """
+        Normalized (label, value) options; assigning new options refreshes the cached prompt choices.
+        """
+        return self._options
+
+    @options.setter
+    def options(self, options) -> None:
+        self._options = self._normalize_options(options)
+        self._choices = tuple(str(i) for i in range(len(self._options)))
+        self._default_index = _option_index(self._options, self._default)
+
+    @property
+    def default(self) -> Any:
+        """
+        Default selected value; assigning it refreshes the cached default index.
+        """
+        return self._default
+
+    @default.setter
+    def default(self, default: Any) -> None:
+        self._default = default
+        self._default_index = _option_index(self._options, default)
+
+    @staticmethod
+    def _normalize_options(options) -> Tuple[Tuple[str, Any], ...]:
+        """
+        Normalize options to (label, value) tuples.
+        2-element lists (as loaded from JSON or YAML) are pairs too; other options are labelled with str(option).
+        """
+        if isinstance(options, tuple) and all(
+            isinstance(option, tuple) and len(option) == 2 for option in options
+        ):
+            return options  # Already normalized, e.g. shared Enum options
+        return tuple(
+            (
+                tuple(option)
+                if isinstance(option, (list, tuple)) and len(option) == 2
+                else (str(option), option)
+            )
+            for option in options
+        )
 
     @classmethod
     def supports(
@@ -131,13 +339,7 @@ class MenuParamSource(ParamSource):
         """
         Supports Enum-annotated parameters by providing a menu of enum values.
         """
-        from enum import Enum
-
-        return (
-            annotation
-            and hasattr(annotation, "__class__")
-            and issubclass(annotation, Enum)
-        )
+        return isinstance(annotation, type) and issubclass(annotation, Enum)
 
     @classmethod
     def from_param(
@@ -149,10 +351,9 @@ class MenuParamSource(ParamSource):
         """
         Create a MenuParamSource from an Enum-annotated parameter.
         """
-        options = [(e.name, e) for e in annotation]
+        options = _enum_options(annotation)
         default = param.default if param.default != inspect.Parameter.empty else None
-        description = getattr(metadata, "description", None) if metadata else None
-        validator = getattr(metadata, "validator", None) if metadata else None
+        description, validator = _metadata_fields(metadata)
         return cls(
             options, default=default, description=description, validator=validator
         )
@@ -163,6 +364,9 @@ class ContextParamSource(ParamSource):
     Parameter source from context.
     """
 
+    kind = "context"
+    __slots__ = ("key", "default")
+
     def __init__(self, key: str, default: Any = None):
         """
         :param key: Context key to retrieve value from.
@@ -202,6 +406,8 @@ class DisplayOutputDestination(OutputDestination):
     Output destination for displaying results.
     """
 
+    __slots__ = ("format",)
+
     def __init__(self, format: str = "{value}"):
         """
         :param format: Format string for displaying the value.
@@ -214,6 +420,8 @@ class ContextOutputDestination(OutputDestination):
     Output destination for saving results to context.
     """
 
+    __slots__ = ("key",)
+
     def __init__(self, key: str):
         """
         :param key: Context key to save the result under.
@@ -233,6 +441,9 @@ class ListParamSource(ParamSource):
     Parameter source for a list of values (multi-value input).
     """
 
+    kind = "list"
+    __slots__ = ("separator", "default", "description", "element_type", "validator")
+
     def __init__(
         self,
         separator: str = ",",
@@ -254,12 +465,33 @@ class ListParamSource(ParamSource):
         self.element_type: type = element_type
         self.validator: Optional[Any] = validator
 
+    def parse(self, raw: str) -> list:
+        """
+        Split raw input on the separator and convert each item to element_type.
+        Large int or float lists are converted by NumPy when it is installed.
+        :param raw: The raw input string.
+        :return: List of converted values.
+        :raises ValueError: If an item cannot be converted to element_type.
+        """
+        if (
+            self.element_type in (int, float)
+            and raw.count(self.separator) >= _NUMPY_MIN_ITEMS
+        ):
+            values = _parse_numeric_list(raw, self.separator, self.element_type)
+            if values is not None:
+                return values
+        items = [item.strip() for item in raw.split(self.separator)]
+        if self.element_type is str:
+            return items
+        try:
+            return [self.element_type(item) for item in items]
+        except TypeError as e:
+            raise ValueError(str(e)) from e
+
     @classmethod
     def supports(
         cls: Type["ListParamSource"], annotation: Any, param: inspect.Parameter
     ) -> bool:
-        from typing import get_origin
-
         return (
             annotation is list
             or annotation is List[Any]
@@ -273,22 +505,11 @@ class ListParamSource(ParamSource):
         param: inspect.Parameter,
         metadata: Optional[Any] = None,
     ) -> "ListParamSource":
-        from typing import get_args
-
         separator = ","
         default = None
-        description = getattr(metadata, "description", None) if metadata else None
-        validator = getattr(metadata, "validator", None) if metadata else None
-        element_type = str
-        if hasattr(annotation, "__args__") and annotation.__args__:
-            element_type = annotation.__args__[0]
-        elif hasattr(annotation, "__origin__") and annotation.__origin__ in (
-            list,
-            List,
-        ):
-            args = get_args(annotation)
-            if args:
-                element_type = args[0]
+        description, validator = _metadata_fields(metadata)
+        args = get_args(annotation)
+        element_type = args[0] if args else str
         return cls(
             separator=separator,
             default=default,
@@ -298,25 +519,89 @@ class ListParamSource(ParamSource):
         )
 
 
+class FileLineStream:
+    """
+    Iterator over the lines of an open file, returned by FileParamSource.read when streaming.
+    The file is closed once the lines are exhausted; close it (or use a with block) to stop early.
+    """
+
+    __slots__ = ("_file",)
+
+    def __init__(self, f: IO):
+        """
+        :param f: The open file object.
+        """
+        self._file = f
+
+    def __iter__(self) -> "FileLineStream":
+        return self
+
+    def __next__(self) -> Any:
+        if self._file.closed:
+            raise StopIteration
+        try:
+            return next(self._file)
+        except StopIteration:
+            self._file.close()
+            raise
+
+    @property
+    def closed(self) -> bool:
+        """True once the underlying file is closed."""
+        return self._file.closed
+
+    def close(self) -> None:
+        """Close the underlying file; iteration then stops."""
+        self._file.close()
+
+    def __enter__(self) -> "FileLineStream":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
 class FileParamSource(ParamSource):
     """
     Parameter source for file input (reads file content as parameter value).
     """
 
+    kind = "file"
+    __slots__ = ("mode", "description", "validator", "streaming")
+
     def __init__(
         self,
         mode: str = "r",
         description: Optional[str] = None,
         validator: Optional[Any] = None,
+        streaming: bool = False,
     ):
         """
         :param mode: File open mode (default: 'r').
         :param description: Description for the parameter.
         :param validator: Callable for custom validation (value -> bool or raises).
+        :param streaming: Pass an iterator over the file's lines instead of its full content.
         """
         self.mode: str = mode
         self.description: Optional[str] = description
         self.validator: Optional[Any] = validator
+        self.streaming: bool = streaming
+
+    def read(self, path: str) -> Any:
+        """
+        Read the parameter value from a file.
+        :param path: Path of the file to read.
+        :return: The file content, or a FileLineStream over its lines if streaming.
+        """
+        if self.streaming:
+            # Opened here so a missing file is reported before the function runs
+            return FileLineStream(open(path, self.mode, buffering=_STREAM_BUFFER_SIZE))
+        if "b" in self.mode:
+            # Unbuffered: FileIO.readall sizes its buffer from the file size
+            with open(path, self.mode, buffering=0) as f:
+                return f.read()
+        with open(path, self.mode) as f:
+            return f.read()
 
     @classmethod
     def supports(
@@ -334,8 +619,7 @@ class FileParamSource(ParamSource):
         metadata: Optional[Any] = None,
     ) -> Optional["FileParamSource"]:
         mode = "r"
-        description = getattr(metadata, "description", None) if metadata else None
-        validator = getattr(metadata, "validator", None) if metadata else None
+        description, validator = _metadata_fields(metadata)
         return cls(mode=mode, description=description, validator=validator)
 
 
@@ -344,6 +628,8 @@ class FileOutputDestination(OutputDestination):
     Output destination for writing results to a file.
     """
 
+    __slots__ = ("path_param", "mode", "description")
+
     def __init__(
         self, path_param: str, mode: str = "w", description: Optional[str] = None
     ):
@@ -362,20 +648,34 @@ class ParameterMetadata:
     Metadata for a function parameter, including description, required, default, and validator.
     """
 
+    __slots__ = (
+        "description",
+        "required",
+        "default",
+        "validator",
+        "jit",
+        "__weakref__",
+    )
+
+    _display_type_name = "any"
+
     def __init__(
         self,
         description: Optional[str] = None,
         required: bool = True,
         default: Any = None,
         validator: Optional[Any] = None,
+        jit: bool = False,
     ):
         """
         :param description: Description for the parameter.
         :param required: Whether the parameter is required.
         :param default: Default value for the parameter.
-        :param validator: Callable for custom validation (value -> bool or raises).
+        :param validator: Callable for custom validation (value -> bool or raises), or a regex pattern the value must fully match.
+        :param jit: Compile the validator with numba.njit when numba is installed.
         """
         self.description: Optional[str] = description
         self.required: bool = required
         self.default: Any = default
         self.validator: Optional[Any] = validator
+        self.jit: bool = jit
@@ -4,17 +4,82 @@ bridges.interfaces.cli.core
 Core CLI interface for bridges framework.
 """
 
-from typing import Any, Dict
-
-from rich import box
-from rich.console import Console
-from rich.panel import Panel
-from rich.prompt import Confirm, Prompt
-from rich.text import Text
+import sys
+from collections import deque
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from ...core.base import BridgeInterface
-from .display import HelpDisplay, ResultDisplay
-from .prompts import ParameterCollector
+
+
+class _CLIConfig:
+    """
+    CLI configuration with slotted attribute access.
+    Also supports the dict API it replaces (item access, in, iteration, keys, items, get, update); unknown keys go to extra.
+    """
+
+    __slots__ = (
+        "prompt",
+        "theme",
+        "show_banner",
+        "banner_name",
+        "banner_description",
+        "history_size",
+        "extra",
+    )
+    _FIELDS = frozenset(__slots__) - {"extra"}
+
+    def __init__(
+        self,
+        prompt: str,
+        theme: str = "blue",
+        show_banner: bool = True,
+        banner_name: str = "",
+        banner_description: str = "",
+        history_size: int = 1000,
+    ):
+        self.prompt = prompt
+        self.theme = theme
+        self.show_banner = show_banner
+        self.banner_name = banner_name
+        self.banner_description = banner_description
+        self.history_size = history_size
+        self.extra: Dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._FIELDS:
+            return getattr(self, key)
+        return self.extra[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key in self._FIELDS:
+            setattr(self, key, value)
+        else:
+            self.extra[key] = value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def update(self, config: Dict[str, Any]) -> None:
+        for key, value in config.items():
+            self[key] = value
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._FIELDS or key in self.extra
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys())
+
+    def __len__(self) -> int:
+        return len(self._FIELDS) + len(self.extra)
+
+    def keys(self) -> List[str]:
+        return [name for name in self.__slots__ if name != "extra"] + list(self.extra)
+
+    def items(self) -> List[Tuple[str, Any]]:
+        return [(key, self[key]) for key in self.keys()]
 
 
 class CLI(BridgeInterface):
@@ -23,6 +88,16 @@ class CLI(BridgeInterface):
     Now supports interactive bridge switching if initialized with a bridge registry.
     """
 
+    # Built-in command aliases and the methods handling them
+    _BUILTIN_ALIASES = (
+        (("help", "h"), "_do_help"),
+        (("list", "ls", "l"), "_do_list"),
+        (("info", "i"), "_do_info"),
+        (("instances", "list-instances"), "_do_instances"),
+        (("bridges",), "_do_bridges"),
+        (("quit", "exit", "q"), "_do_exit"),
+    )
+
     def __init__(self, bridge_or_registry, name: str = "CLI", description: str = ""):
         # Support both single bridge and registry of bridges
         if isinstance(bridge_or_registry, dict):
@@ -37,70 +112,111 @@ class CLI(BridgeInterface):
             self.bridge = bridge_or_registry
             self.multi_bridge = False
         super().__init__(self.bridge)
+        # Rich is imported when a CLI is created, not when this module is imported
+        from rich.console import Console
+
+        from .display import HelpDisplay, ResultDisplay
+        from .prompts import ParameterCollector
+
         self.console = Console()
         self.name = name
         self.description = description
-        self.config = {
-            "prompt": f"{self._make_prompt()}",
-            "theme": "blue",
-            "show_banner": True,
-            "banner_name": self.name,
-            "banner_description": self.description,
-        }
-        self.history = []
+        self._prompt_cache = None
+        self.config = _CLIConfig(
+            prompt=self._make_prompt(),
+            banner_name=self.name,
+            banner_description=self.description,
+        )
+        # Most recent commands, bounded by config.history_size
+        self.history = deque(maxlen=self.config.history_size)
+        self._banner = None
+        # Case-folded alias -> function name, set via customize({"aliases": {...}})
         self.command_aliases = {}
         self.param_collector = ParameterCollector(self.console)
         self.result_display = ResultDisplay(self.console)
         self.help_display = HelpDisplay(self.console)
-        self._func_name_map = {fname.lower(): fname for fname in self.bridge.functions}
+        self._builtins = {
+            sys.intern(alias): getattr(self, handler)
+            for aliases, handler in self._BUILTIN_ALIASES
+            for alias in aliases
+        }
+        if self.multi_bridge:
+            self._builtins["switch"] = self._handle_switch_command
 
     def _make_prompt(self):
-        if self.multi_bridge:
-            return f"{self.active_bridge_name}> "
-        return f"{self.name}> "
+        """Return the prompt for the active bridge, reusing it while the bridge and name are unchanged."""
+        key = (self.active_bridge_name, self.name)
+        if self._prompt_cache is None or self._prompt_cache[0] != key:
+            if self.multi_bridge:
+                prompt = f"{self.active_bridge_name}> "
+            else:
+                prompt = f"{self.name}> "
+            self._prompt_cache = (key, prompt)
+        return self._prompt_cache[1]
 
     def customize(self, config: Dict[str, Any]):
         """Customize the CLI with configuration options."""
-        super().customize(config)
+        config = dict(config)
+        aliases = config.pop("aliases", None)
+        if aliases:
+            self.command_aliases.update(
+                (sys.intern(alias.casefold()), func_name)
+                for alias, func_name in aliases.items()
+            )
+        self.config.update(config)
         # Update name/description if provided
         if "banner_name" in config:
             self.name = config["banner_name"]
         if "banner_description" in config:
             self.description = config["banner_description"]
-        if "prompt" in config:
-            self.config["prompt"] = config["prompt"]
-        else:
-            self.config["prompt"] = f"{self.name}> "
+        if "prompt" not in config:
+            self.config.prompt = f"{self.name}> "
+        if "history_size" in config:
+            self.history = deque(self.history, maxlen=self.config.history_size)
 
     def _print_banner(self):
         """Print the CLI banner."""
-        if self.config.get("show_banner", True):
-            banner = Text(self.name, style="bold blue")
-            subtitle = Text(self.description, style="dim") if self.description else ""
-            panel = Panel(
-                f"{banner}\n{subtitle}" if subtitle else f"{banner}",
-                box=box.ROUNDED,
-                style="blue",
-                padding=(1, 2),
-            )
-            self.console.print(panel)
+        if self.config.show_banner:
+            # The panel is rebuilt only when the name or description changes
+            key = (self.name, self.description)
+            if self._banner is None or self._banner[0] != key:
+                from rich import box
+                from rich.panel import Panel
+                from rich.text import Text
+
+                banner = Text(self.name, style="bold blue")
+                subtitle = (
+                    Text(self.description, style="dim") if self.description else ""
+                )
+                panel = Panel(
+                    f"{banner}\n{subtitle}" if subtitle else f"{banner}",
+                    box=box.ROUNDED,
+                    style="blue",
+                    padding=(1, 2),
+                )
+                self._banner = (key, panel)
+            self.console.print(self._banner[1])
             self.console.print()
 
     def run(self):
         """Run the CLI interface."""
-        self._print_banner()
-        if not self.bridge.functions:
-            self.console.print("[yellow]No functions registered.[/yellow]")
-            return
-        self.console.print("[dim]Type 'help' for available commands[/dim]\n")
-        self._func_name_map = {fname.lower(): fname for fname in self.bridge.functions}
+        from rich.prompt import Prompt
+
+        # The start-up screen is written in one go
+        with self.console:
+            self._print_banner()
+            if not self.bridge.functions:
+                self.console.print("[yellow]No functions registered.[/yellow]")
+                return
+            self.console.print("[dim]Type 'help' for available commands[/dim]\n")
         while True:
             try:
-                command = Prompt.ask(self.config["prompt"]).strip()
+                command = Prompt.ask(self.config.prompt).strip()
                 if not command:
                     continue
                 self.history.append(command)
-                self._handle_command(command)
+                if self._handle_command(command):
+                    break
             except KeyboardInterrupt:
                 self.console.print("\n[yellow]Use 'quit' to exit[/yellow]")
             except EOFError:
@@ -109,28 +225,31 @@ class CLI(BridgeInterface):
             except Exception as e:
                 self.console.print(f"[red]Unexpected error: {e}[/red]")
 
-    def _handle_command(self, command: str):
-        """Parse and handle a single CLI command."""
-        parts = command.split()
+    def _handle_command(self, command: str) -> bool:
+        """Parse and handle a single CLI command. Returns True if the CLI should exit."""
+        # Split off the command word on any whitespace, like the tokenizing of arguments
+        parts = command.split(None, 1)
         if not parts:
-            return
+            return False
         cmd_raw = parts[0]
-        cmd = cmd_raw.lower()
-        args = parts[1:] if len(parts) > 1 else []
-        # Bridge switching
-        if self.multi_bridge and cmd == "switch":
-            self._handle_switch_command(args)
-            return
-        # Built-in commands
-        if self._handle_builtin_command(cmd, args):
-            return
-        # Case-insensitive function lookup
-        func_name = self._func_name_map.get(cmd)
-        if func_name:
+        rest = parts[1] if len(parts) > 1 else ""
+        # ASCII lower-case input (the usual case) is already case-folded
+        cmd = cmd_raw if cmd_raw.isascii() and cmd_raw.islower() else cmd_raw.casefold()
+        # Case-insensitive function lookup first (the common case), then aliases; built-in names take precedence
+        func_name = self.bridge.lookup(cmd) or self.command_aliases.get(cmd)
+        if func_name in self.bridge.functions and cmd not in self._builtins:
             self._execute_function_command(func_name)
-        else:
+            return False
+        # Only built-ins take arguments, so the rest is tokenized here
+        args = rest.split()
+        # Built-in commands (including 'switch' for multi-bridge CLIs)
+        handled = self._handle_builtin_command(cmd, args)
+        if handled is None:
+            return True
+        if not handled:
             self.console.print(f"[red]Unknown command: {cmd_raw}[/red]")
             self.console.print("[dim]Type 'help' for available commands[/dim]")
+        return False
 
     def _handle_switch_command(self, args):
         """Handle the 'switch' command for changing active bridge."""
@@ -141,54 +260,73 @@ class CLI(BridgeInterface):
         if bname in self.bridges:
             self.active_bridge_name = bname
             self.bridge = self.bridges[bname]
-            self._func_name_map = {
-                fname.lower(): fname for fname in self.bridge.functions
-            }
-            self.config["prompt"] = self._make_prompt()
+            self.config.prompt = self._make_prompt()
             self.console.print(f"[green]Switched to bridge: {bname}[/green]")
         else:
             self.console.print(f"[red]Unknown bridge: {bname}[/red]")
 
-    def _handle_builtin_command(self, cmd: str, args: list) -> bool:
-        """Handle built-in CLI commands. Returns True if handled."""
-        if cmd in ["help", "h"]:
-            self.help_display.print_help()
-            return True
-        elif cmd in ["list", "ls", "l"]:
-            self.help_display.list_functions(self.bridge)
-            return True
-        elif cmd in ["info", "i"]:
-            if args:
-                self.help_display.show_function_info(self.bridge, args[0])
-            else:
-                self.console.print("[red]Usage: info <function_name>[/red]")
-            return True
-        elif cmd in ["instances", "list-instances"]:
-            instances = self.bridge.list_all_instances()
-            if not instances:
-                self.console.print(
-                    "[yellow]No class instances found in context.[/yellow]"
+    def _handle_builtin_command(self, cmd: str, args: list) -> Optional[bool]:
+        """
+        Handle built-in CLI commands.
+        Returns True if handled, False if cmd is not a built-in, and None if the CLI should exit.
+        """
+        handler = self._builtins.get(cmd)
+        if handler is None:
+            return False
+        if handler(args):
+            return None
+        return True
+
+    def _do_help(self, args: list):
+        """Show the help panel."""
+        self.help_display.print_help()
+
+    def _do_list(self, args: list):
+        """List the functions of the active bridge."""
+        self.help_display.list_functions(self.bridge)
+
+    def _do_info(self, args: list):
+        """Show details for one function."""
+        if args:
+            self.help_display.show_function_info(self.bridge, args[0])
+        else:
+            self.console.print("[red]Usage: info <function_name>[/red]")
+
+    def _do_instances(self, args: list):
+        """List stateful class instances stored in context."""
+        instances = self.bridge.list_all_instances()
+        if not instances:
+            self.console.print("[yellow]No class instances found in context.[/yellow]")
+        else:
+            lines = ["[bold blue]Instances by class:[/bold blue]"]
+            lines.extend(
+                f"[cyan]{cls}[/cyan]: {', '.join(names)}"
+                for cls, names in instances.items()
+            )
+            self.console.print("\n".join(lines))
+
+    def _do_bridges(self, args: list):
+        """List available bridges, marking the active one."""
+        if getattr(self, "multi_bridge", False) and self.bridges:
+            lines = ["[bold blue]Available bridges:[/bold blue]"]
+            lines.extend(
+                (
+                    f"[green]{bname} (active)[/green]"
+                    if bname == self.active_bridge_name
+                    else f"[cyan]{bname}[/cyan]"
                 )
-            else:
-                self.console.print("[bold blue]Instances by class:[/bold blue]")
-                for cls, names in instances.items():
-                    self.console.print(f"[cyan]{cls}[/cyan]: {', '.join(names)}")
-            return True
-        elif cmd == "bridges":
-            if getattr(self, "multi_bridge", False) and self.bridges:
-                self.console.print("[bold blue]Available bridges:[/bold blue]")
-                for bname in self.bridges:
-                    if bname == self.active_bridge_name:
-                        self.console.print(f"[green]{bname} (active)[/green]")
-                    else:
-                        self.console.print(f"[cyan]{bname}[/cyan]")
-            else:
-                self.console.print("[yellow]Only one bridge is active.[/yellow]")
-            return True
-        elif cmd in ["quit", "exit", "q"]:
-            if Confirm.ask("Are you sure you want to exit?"):
-                self.console.print("[green]Goodbye! 👋[/green]")
-                exit(0)
+                for bname in self.bridges
+            )
+            self.console.print("\n".join(lines))
+        else:
+            self.console.print("[yellow]Only one bridge is active.[/yellow]")
+
+    def _do_exit(self, args: list) -> bool:
+        """Ask for confirmation and return True if the CLI should exit."""
+        from rich.prompt import Confirm
+
+        if Confirm.ask("Are you sure you want to exit?"):
+            self.console.print("[green]Goodbye! 👋[/green]")
             return True
         return False
 
@@ -4,54 +4,135 @@ bridges.interfaces.cli.display
 Display logic for CLI interface results and help.
 """
 
-from typing import Any
+import weakref
+from collections.abc import Iterator
+from itertools import islice
+from typing import Any, Tuple
 
-from rich import box
 from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
+from rich.text import Text
+
+# Table, Panel and box are imported by the methods that render them
+
+# Shared cells for the parameter table
+_YES = Text("Yes")
+_NO = Text("No")
+_NONE = Text("-")
+
+# Result types printed on a single line after a prebuilt label
+_SCALAR_TYPES = (str, int, float, bool)
+_RESULT_LABEL = Text("Result: ", style="bold green")
+
+# Dict results with at least this many keys are shown in a borderless grid
+_GRID_MIN_ROWS = 32
 
 
 class ResultDisplay:
     """Handles result display formatting."""
 
+    # Result type -> display method; subclasses and other types are classified on first sight
+    _DISPLAY_METHODS = {
+        type(None): "_display_none",
+        str: "_display_scalar",
+        int: "_display_scalar",
+        float: "_display_scalar",
+        bool: "_display_scalar",
+        dict: "_display_dict",
+        list: "_display_items",
+        tuple: "_display_items",
+    }
+
     def __init__(self, console: Console):
         self.console = console
+        self._displays = {
+            result_type: getattr(self, method)
+            for result_type, method in self._DISPLAY_METHODS.items()
+        }
 
     def display_result(self, result: Any):
         """Display the result with rich formatting."""
-        if result is None:
-            self.console.print("[dim]Function completed (no output)[/dim]")
-            return
+        display = self._displays.get(type(result))
+        if display is None:
+            display = self._displays[type(result)] = self._classify(result)
+        display(result)
 
-        # Try to format the result nicely
+    def _classify(self, result: Any):
+        """Choose the display method for a result type missing from the table."""
+        if isinstance(result, _SCALAR_TYPES):
+            return self._display_scalar
         if isinstance(result, dict):
-            table = Table(
-                title="[bold green]Result[/bold green]",
-                show_header=True,
-                header_style="bold green",
-            )
-            table.add_column("Key", style="cyan")
-            table.add_column("Value", style="white")
+            return self._display_dict
+        if isinstance(result, (list, tuple, Iterator)):
+            return self._display_items
+        return self._display_other
+
+    def _display_none(self, result: None):
+        """Report a function that returned nothing."""
+        self.console.print("[dim]Function completed (no output)[/dim]")
+
+    def _display_scalar(self, result: Any):
+        """Print a scalar without markup parsing or highlighting."""
+        self.console.print(
+            Text.assemble(_RESULT_LABEL, str(result)),
+            markup=False,
+            highlight=False,
+        )
+
+    def _display_other(self, result: Any):
+        """Print any other result on one line."""
+        self.console.print(f"[bold green]Result:[/bold green] {result}")
+
+    def _display_dict(self, result: dict):
+        """Print a dict as a key/value table."""
+        from rich.table import Table
+
+        # Buffered: everything for one result is written to the terminal at once
+        with self.console:
+            if len(result) < _GRID_MIN_ROWS:
+                table = Table(
+                    title="[bold green]Result[/bold green]",
+                    show_header=True,
+                    header_style="bold green",
+                )
+                table.add_column("Key", style="cyan")
+                table.add_column("Value", style="white")
+            else:
+                # Large results use a borderless grid, which skips border layout
+                self.console.print(
+                    f"[bold green]Result:[/bold green] {len(result)} keys"
+                )
+                table = Table.grid(padding=(0, 2))
+                table.add_column(style="cyan")
+                table.add_column(style="white")
 
             for key, value in result.items():
                 table.add_row(str(key), str(value))
 
             self.console.print(table)
-        elif isinstance(result, (list, tuple)):
-            if len(result) > 10:
-                self.console.print(
-                    f"[bold green]Result:[/bold green] {len(result)} items"
-                )
-                for i, item in enumerate(result[:5]):
-                    self.console.print(f"  {i}: {item}")
-                self.console.print(f"  ... and {len(result) - 5} more items")
+
+    def _display_items(self, result: Any):
+        """Print a list, tuple or iterator, truncated after ten items."""
+        if isinstance(result, Iterator):
+            # Iterators are never counted; only the items needed are consumed
+            result = list(islice(result, 11))
+            more = f"{len(result) - 1}+" if len(result) > 10 else None
+        else:
+            more = len(result) if len(result) > 10 else None
+        with self.console:
+            if more is not None:
+                self.console.print(f"[bold green]Result:[/bold green] {more} items")
+                shown = result[:5]
             else:
                 self.console.print("[bold green]Result:[/bold green]")
-                for i, item in enumerate(result):
-                    self.console.print(f"  {i}: {item}")
-        else:
-            self.console.print(f"[bold green]Result:[/bold green] {result}")
+                shown = result
+            # One write for all items; item text is printed as-is, not parsed as markup
+            lines = [f"  {i}: {item}" for i, item in enumerate(shown)]
+            if isinstance(more, int):
+                lines.append(f"  ... and {more - 5} more items")
+            elif more is not None:
+                lines.append("  ... and more items")
+            if lines:
+                self.console.print("\n".join(lines), markup=False, highlight=False)
 
 
 class HelpDisplay:
@@ -59,6 +140,10 @@ class HelpDisplay:
 
     def __init__(self, console: Console):
         self.console = console
+        # Console width -> rendered help panel segments
+        self._help_cache = {}
+        # Bridge -> ((name, console width, function fingerprint), rendered function table)
+        self._list_cache = weakref.WeakKeyDictionary()
 
     def print_help(self):
         """Print help information."""
@@ -81,8 +166,20 @@ class HelpDisplay:
   [green]bridges[/green]              - List all bridges
         """
 
-        panel = Panel(help_text, title="[bold blue]Help[/bold blue]", box=box.ROUNDED)
-        self.console.print(panel)
+        width = self.console.width
+        segments = self._help_cache.get(width)
+        if segments is None:
+            from rich import box
+            from rich.panel import Panel
+            from rich.segment import Segments
+
+            panel = Panel(
+                help_text, title="[bold blue]Help[/bold blue]", box=box.ROUNDED
+            )
+            segments = self._help_cache[width] = Segments(
+                self.console.render(panel, self.console.options)
+            )
+        self.console.print(segments)
 
     def list_functions(self, bridge):
         """List all available functions in a table."""
@@ -90,6 +187,29 @@ class HelpDisplay:
             self.console.print("[yellow]No functions registered.[/yellow]")
             return
 
+        # The table is re-rendered only when a shown field changes or the console is resized;
+        # the fingerprint also catches functions added or removed through bridge.functions
+        key = (
+            bridge.name,
+            self.console.width,
+            tuple(
+                (
+                    name,
+                    id(func_meta),
+                    func_meta.description,
+                    len(func_meta.params or ()),
+                )
+                for name, func_meta in bridge.functions.items()
+            ),
+        )
+        cached = self._list_cache.get(bridge)
+        if cached is not None and cached[0] == key:
+            self.console.print(cached[1])
+            return
+
+        from rich.segment import Segments
+        from rich.table import Table
+
         table = Table(
             title=f"[bold blue]Available Functions in {bridge.name}[/bold blue]"
         )
@@ -97,12 +217,21 @@ class HelpDisplay:
         table.add_column("Description", style="white")
         table.add_column("Parameters", style="dim")
 
-        for name, func_meta in bridge.functions.items():
-            param_count = len(func_meta.params) if func_meta.params else 0
-            description = func_meta.description or "No description"
-            table.add_row(name, description, f"{param_count} params")
+        # Plain Text cells are not parsed for markup
+        rows = [
+            (
+                Text(name),
+                Text(func_meta.description or "No description"),
+                Text(f"{len(func_meta.params) if func_meta.params else 0} params"),
+            )
+            for name, func_meta in bridge.functions.items()
+        ]
+        for row in rows:
+            table.add_row(*row)
 
-        self.console.print(table)
+        segments = Segments(self.console.render(table, self.console.options))
+        self._list_cache[bridge] = (key, segments)
+        self.console.print(segments)
 
     def show_function_info(self, bridge, func_name: str):
         """Show detailed information about a function."""
@@ -110,6 +239,10 @@ class HelpDisplay:
             self.console.print(f"[red]Function '{func_name}' not found.[/red]")
             return
 
+        from rich import box
+        from rich.panel import Panel
+        from rich.table import Table
+
         func_meta = bridge.functions[func_name]
 
         # Function header
@@ -127,6 +260,28 @@ class HelpDisplay:
         param_table.add_column("Default", style="dim")
         param_table.add_column("Description", style="white")
 
+        # Built on every call, so edits to sources, defaults, and descriptions show up
+        rows, output_info = self._build_info(func_meta)
+        for row in rows:
+            param_table.add_row(*row)
+
+        # Display everything in one buffered write
+        with self.console:
+            self.console.print(
+                Panel(
+                    header,
+                    title="[bold blue]Function Information[/bold blue]",
+                    box=box.ROUNDED,
+                )
+            )
+            if param_table.row_count > 0:
+                self.console.print(param_table)
+            if output_info:
+                self.console.print(output_info)
+
+    def _build_info(self, func_meta) -> Tuple[Tuple[Tuple[Text, ...], ...], str]:
+        """Build the parameter table rows and output summary of a function."""
+        rows = []
         for param_name, param_meta in func_meta.params.items():
             # Handle type display safely
             if hasattr(param_meta, "element_type"):
@@ -139,25 +294,29 @@ class HelpDisplay:
                     param_type = str(element_type)
             else:
                 # For ParameterMetadata and other param sources without element_type
-                param_type = (
-                    type(param_meta)
-                    .__name__.replace("ParamSource", "")
-                    .replace("ParameterMetadata", "any")
-                )
+                param_type = getattr(type(param_meta), "_display_type_name", None)
+                if param_type is None:
+                    param_type = (
+                        type(param_meta)
+                        .__name__.replace("ParamSource", "")
+                        .replace("ParameterMetadata", "any")
+                    )
 
-            required = (
-                "Yes"
-                if not hasattr(param_meta, "default") or param_meta.default is None
-                else "No"
-            )
-            default = (
-                str(param_meta.default)
-                if hasattr(param_meta, "default") and param_meta.default is not None
-                else "-"
-            )
+            default = getattr(param_meta, "default", None)
+            if default is None:
+                required, default_text = _YES, _NONE
+            else:
+                required, default_text = _NO, Text(str(default))
             description = getattr(param_meta, "description", "") or "-"
-
-            param_table.add_row(param_name, param_type, required, default, description)
+            rows.append(
+                (
+                    Text(param_name),
+                    Text(param_type),
+                    required,
+                    default_text,
+                    Text(description),
+                )
+            )
 
         # Output information
         output_info = ""
@@ -165,16 +324,4 @@ class HelpDisplay:
             output_info = "\n[bold]Outputs:[/bold]\n"
             for i, output in enumerate(func_meta.output):
                 output_info += f"  {i+1}. {type(output).__name__}\n"
-
-        # Display everything
-        self.console.print(
-            Panel(
-                header,
-                title="[bold blue]Function Information[/bold blue]",
-                box=box.ROUNDED,
-            )
-        )
-        if param_table.row_count > 0:
-            self.console.print(param_table)
-        if output_info:
-            self.console.print(output_info)
+        return tuple(rows), output_info
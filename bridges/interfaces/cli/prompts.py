@@ -4,32 +4,60 @@ bridges.interfaces.cli.prompts
 Parameter collection logic for CLI interface.
 """
 
-from typing import Any, Dict, Optional
+import weakref
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Optional, Tuple
 
 from rich.console import Console
-from rich.prompt import Prompt
+from rich.text import Text
+
+from ...core.types import _option_index
+
+# Shared read-only context for functions not attached to a bridge
+_NO_CONTEXT = MappingProxyType({})
+
+# Fixed messages, styled once instead of parsing markup on every print
+_MSG_CANCEL_HINT = Text("Press Ctrl+C to cancel\n", style="dim")
+_MSG_CANCELLED = Text("\nCancelled.", style="yellow")
+_MSG_OPTIONS = Text("Available options:", style="yellow")
+_MSG_INVALID_OPTION = Text("Invalid option.", style="red")
+_MSG_NOT_A_NUMBER = Text("Please enter a number.", style="red")
 
 
 class ParameterCollector:
     """Handles parameter collection for different parameter source types."""
 
+    # ParamSource.kind -> collector method; other kinds use plain input
+    _COLLECTORS = {
+        "menu": "_collect_menu_param",
+        "list": "_collect_list_param",
+        "file": "_collect_file_param",
+    }
+
     def __init__(self, console: Console):
         self.console = console
+        # FunctionMetadata -> collection plan, built on first use
+        self._plans = weakref.WeakKeyDictionary()
+        # MenuParamSource -> (options, default index, option list as one Text), rebuilt when either changes
+        self._menu_lines = weakref.WeakKeyDictionary()
 
     def collect_parameters(self, func_meta) -> Optional[Dict[str, Any]]:
         """Collect parameters for a function with rich prompts."""
         params = {}
 
-        self.console.print(f"\n[bold green]Executing: {func_meta.name}[/bold green]")
-        self.console.print("[dim]Press Ctrl+C to cancel[/dim]\n")
+        with self.console:
+            self.console.print(
+                f"\n[bold green]Executing: {func_meta.name}[/bold green]"
+            )
+            self.console.print(_MSG_CANCEL_HINT)
 
         # Get bridge context if available
         bridge = getattr(func_meta, "bridge", None)
-        context = getattr(bridge, "context", {}) if bridge else {}
+        context = getattr(bridge, "context", _NO_CONTEXT) if bridge else _NO_CONTEXT
 
-        for param_name, param_meta in func_meta.params.items():
+        for param_name, param_meta, header, collect in self._get_plan(func_meta):
             # Auto-fill from context for ContextParamSource
-            if type(param_meta).__name__ == "ContextParamSource":
+            if collect is None:
                 value = param_meta.get_value(context)
                 params[param_name] = value
                 self.console.print(
@@ -37,83 +65,130 @@ class ParameterCollector:
                 )
                 continue
             try:
-                # Parameter header
-                param_header = f"[bold cyan]{param_name}[/bold cyan]"
-                if hasattr(param_meta, "description") and param_meta.description:
-                    param_header += f" - [dim]{param_meta.description}[/dim]"
-                self.console.print(param_header)
-
-                if hasattr(param_meta, "options"):  # MenuParamSource
-                    self._collect_menu_param(param_name, param_meta, params)
-                elif hasattr(param_meta, "separator"):  # ListParamSource
-                    self._collect_list_param(param_name, param_meta, params)
-                elif hasattr(param_meta, "mode"):  # FileParamSource
-                    self._collect_file_param(param_name, param_meta, params)
-                else:  # Default input
-                    self._collect_input_param(param_name, param_meta, params)
-
+                self.console.print(header)
+                collect(param_name, param_meta, params)
                 self.console.print()  # Add spacing between parameters
 
             except KeyboardInterrupt:
-                self.console.print("\n[yellow]Cancelled.[/yellow]")
+                self.console.print(_MSG_CANCELLED)
                 return None
 
         return params
 
+    def _get_plan(
+        self, func_meta
+    ) -> Tuple[Tuple[str, Any, Optional[Text], Optional[Callable]], ...]:
+        """
+        Return the collection plan for a function: one (name, source, header, collector) entry per parameter.
+        The plan is built once per function; the collector is None for context-filled parameters.
+        """
+        plan = self._plans.get(func_meta)
+        if plan is None:
+            plan = self._plans[func_meta] = tuple(
+                self._plan_param(param_name, param_meta)
+                for param_name, param_meta in func_meta.params.items()
+            )
+        return plan
+
+    def _plan_param(self, param_name: str, param_meta):
+        """Choose the header text and collector method for one parameter."""
+        kind = getattr(param_meta, "kind", None)
+        if kind is None:
+            # Sources without a kind tag (e.g. ParameterMetadata) are classified by their attributes
+            if hasattr(param_meta, "options"):
+                kind = "menu"
+            elif hasattr(param_meta, "separator"):
+                kind = "list"
+            elif hasattr(param_meta, "mode"):
+                kind = "file"
+        if kind == "context":
+            return param_name, param_meta, None, None
+        # Parameter header
+        header = f"[bold cyan]{param_name}[/bold cyan]"
+        if getattr(param_meta, "description", None):
+            header += f" - [dim]{param_meta.description}[/dim]"
+        # Parsed once here; the plan is reused for every call
+        header = Text.from_markup(header)
+        collect = getattr(self, self._COLLECTORS.get(kind, "_collect_input_param"))
+        return param_name, param_meta, header, collect
+
     def _collect_menu_param(self, param_name: str, param_meta, params: Dict[str, Any]):
         """Collect menu parameter selection."""
-        self.console.print("[yellow]Available options:[/yellow]")
-        for i, (label, value) in enumerate(param_meta.options):
-            marker = (
-                "→"
-                if hasattr(param_meta, "default") and param_meta.default == value
-                else " "
+        from rich.prompt import Prompt
+
+        options = param_meta.options
+        if not isinstance(options, tuple):
+            options = tuple(options)
+        choices = getattr(param_meta, "_choices", None)
+        if choices is None:
+            choices = [str(i) for i in range(len(options))]
+            default_index = _option_index(options, getattr(param_meta, "default", None))
+        else:
+            default_index = param_meta._default_index
+        default = None if default_index is None else choices[default_index]
+
+        # The rendered list is reused while the options and default are unchanged
+        cached = self._menu_lines.get(param_meta)
+        if cached is None or cached[1] != default_index or cached[0] != options:
+            cached = self._menu_lines[param_meta] = (
+                options,
+                default_index,
+                self._build_menu_lines(options, default_index),
             )
-            self.console.print(f"  {marker} [cyan]{i}[/cyan]: {label}")
-
+        # The heading and option list are rendered as one Text before prompting
+        self.console.print(cached[2])
         while True:
-            choice = Prompt.ask(
-                "Select option",
-                choices=[str(i) for i in range(len(param_meta.options))],
-                default=(
-                    str(
-                        param_meta.options.index(
-                            (param_meta.default, param_meta.default)
-                        )
-                    )
-                    if hasattr(param_meta, "default") and param_meta.default
-                    else None
-                ),
-            )
+            choice = Prompt.ask("Select option", choices=choices, default=default)
             try:
                 index = int(choice)
-                if 0 <= index < len(param_meta.options):
-                    params[param_name] = param_meta.options[index][1]
-                    self.console.print(
-                        f"[green]Selected: {param_meta.options[index][0]}[/green]"
-                    )
+                if 0 <= index < len(options):
+                    params[param_name] = options[index][1]
+                    self.console.print(f"[green]Selected: {options[index][0]}[/green]")
                     break
                 else:
-                    self.console.print("[red]Invalid option.[/red]")
+                    self.console.print(_MSG_INVALID_OPTION)
             except ValueError:
-                self.console.print("[red]Please enter a number.[/red]")
+                self.console.print(_MSG_NOT_A_NUMBER)
+
+    def _build_menu_lines(
+        self, options: Tuple[Tuple[str, Any], ...], default_index: Optional[int]
+    ) -> Text:
+        """Build the option list of a menu, marking the default option."""
+        return Text("\n").join(
+            (
+                _MSG_OPTIONS,
+                *(
+                    Text.assemble(
+                        f"  {'→' if i == default_index else ' '} ",
+                        (str(i), "cyan"),
+                        f": {label}",
+                    )
+                    for i, (label, _) in enumerate(options)
+                ),
+            )
+        )
 
     def _collect_list_param(self, param_name: str, param_meta, params: Dict[str, Any]):
         """Collect list parameter input."""
+        from rich.prompt import Prompt
+
         prompt_text = f"Enter values (separated by '{param_meta.separator}')"
         if hasattr(param_meta, "default") and param_meta.default:
             prompt_text += f" [default: {param_meta.default}]"
 
         value = Prompt.ask(prompt_text)
         if value:
-            # Convert string list to proper type
-            items = [item.strip() for item in value.split(param_meta.separator)]
-            if param_meta.element_type is not str:
-                try:
-                    items = [param_meta.element_type(item) for item in items]
-                except (ValueError, TypeError):
-                    self.console.print(f"[red]Invalid values for {param_name}[/red]")
-                    return
+            try:
+                if hasattr(param_meta, "parse"):
+                    items = param_meta.parse(value)
+                else:
+                    items = [item.strip() for item in value.split(param_meta.separator)]
+                    element_type = getattr(param_meta, "element_type", str)
+                    if element_type is not str:
+                        items = [element_type(item) for item in items]
+            except (ValueError, TypeError):
+                self.console.print(f"[red]Invalid values for {param_name}[/red]")
+                return
             params[param_name] = items
             self.console.print(f"[green]Added {len(items)} items[/green]")
         elif hasattr(param_meta, "default") and param_meta.default:
@@ -122,6 +197,8 @@ class ParameterCollector:
 
     def _collect_file_param(self, param_name: str, param_meta, params: Dict[str, Any]):
         """Collect file parameter input, handling both read and write modes."""
+        from rich.prompt import Prompt
+
         mode = getattr(param_meta, "mode", "r")
         while True:
             file_path = Prompt.ask("Enter file path (or type 'cancel' to skip)")
@@ -132,8 +209,11 @@ class ParameterCollector:
                 return
             if "r" in mode:
                 try:
-                    with open(file_path, mode) as f:
-                        params[param_name] = f.read()
+                    if hasattr(param_meta, "read"):
+                        params[param_name] = param_meta.read(file_path)
+                    else:
+                        with open(file_path, mode) as f:
+                            params[param_name] = f.read()
                     self.console.print(f"[green]File loaded: {file_path}[/green]")
                     break
                 except FileNotFoundError:
@@ -154,6 +234,8 @@ class ParameterCollector:
 
     def _collect_input_param(self, param_name: str, param_meta, params: Dict[str, Any]):
         """Collect basic input parameter."""
+        from rich.prompt import Prompt
+
         prompt_text = "Enter value"
         if hasattr(param_meta, "default") and param_meta.default is not None:
             prompt_text += f" [default: {param_meta.default}]"
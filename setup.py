@@ -14,6 +14,7 @@ setup(
     install_requires=[
         "pydantic",
         "rich",
+        "typing_extensions",
     ],
     classifiers=[
         "Programming Language :: Python :: 3",
@@ -20,3 +20,73 @@ def test_cli_custom_name_and_description():
     cli.customize({"banner_name": "AnotherName", "banner_description": "AnotherDesc"})
     assert cli.name == "AnotherName"
     assert cli.description == "AnotherDesc"
+
+
+def test_cli_config_attribute_and_item_access():
+    cli = CLI(Bridge("TestCLIConfig"), name="Cfg")
+    assert cli.config.prompt == cli.config["prompt"] == "Cfg> "
+    cli.customize({"prompt": ">> ", "show_banner": False, "color": "red"})
+    assert cli.config.prompt == ">> "
+    assert cli.config.show_banner is False
+    assert cli.config.get("color") == "red"
+    assert cli.config.get("missing", 1) == 1
+
+
+def test_cli_banner_panel_reused_until_renamed():
+    cli = CLI(Bridge("TestCLIBanner"), name="One")
+    cli._print_banner()
+    panel = cli._banner[1]
+    cli._print_banner()
+    assert cli._banner[1] is panel
+    cli.customize({"banner_name": "Two"})
+    cli._print_banner()
+    assert cli._banner[1] is not panel
+
+
+def test_cli_history_is_bounded():
+    cli = CLI(Bridge("TestCLIHistory"))
+    cli.customize({"history_size": 2})
+    for command in ("a", "b", "c"):
+        cli.history.append(command)
+    assert list(cli.history) == ["b", "c"]
+
+
+def test_cli_aliases_resolve_to_functions():
+    bridge = Bridge("TestCLIAliases")
+    bridge.register(lambda: 1, name="add")
+    cli = CLI(bridge)
+    cli.customize({"aliases": {"Plus": "add", "gone": "missing"}})
+    called = []
+    cli._execute_function_command = called.append
+    assert cli._handle_command("plus") is False
+    assert called == ["add"]
+    cli._handle_command("gone")
+    assert called == ["add"]
+    assert "aliases" not in cli.config.extra
+
+
+def test_cli_config_contains_fields_and_extra():
+    cli = CLI(Bridge("TestCLIConfigContains"))
+    cli.customize({"color": "red"})
+    assert "theme" in cli.config
+    assert "color" in cli.config
+    assert "missing" not in cli.config
+
+
+def test_cli_config_iterates_fields_then_extra():
+    cli = CLI(Bridge("TestCLIConfigIter"))
+    cli.customize({"color": "red"})
+    assert list(iter(cli.config)) == list(cli.config.keys())
+    assert cli.config.keys()[0] == "prompt"
+    assert cli.config.keys()[-1] == "color"
+    assert len(cli.config) == len(cli.config.keys())
+
+
+def test_cli_config_items_and_dict_conversion():
+    cli = CLI(Bridge("TestCLIConfigItems"), name="Items")
+    cli.customize({"color": "red"})
+    assert ("theme", "blue") in cli.config.items()
+    as_dict = dict(cli.config)
+    assert as_dict["prompt"] == "Items> "
+    assert as_dict["color"] == "red"
+    assert "extra" not in as_dict
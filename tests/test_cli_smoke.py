@@ -3,9 +3,24 @@ tests.test_cli_smoke
 Smoke test for CLI instantiation.
 """
 
+import collections
+import io
+import itertools
+import subprocess
+import sys
+from enum import Enum
+
+from rich.console import Console
+
 from bridges.core.basic import Bridge
-from bridges.core.types import DisplayOutputDestination, InputParamSource
+from bridges.core.types import (
+    DisplayOutputDestination,
+    InputParamSource,
+    MenuParamSource,
+)
 from bridges.interfaces.cli import CLI
+from bridges.interfaces.cli.display import HelpDisplay, ResultDisplay
+from bridges.interfaces.cli.prompts import ParameterCollector
 
 
 def test_cli_instantiation():
@@ -23,3 +38,316 @@ def test_cli_instantiation():
     assert hasattr(cli, "run")
     assert hasattr(cli, "help_display")
     cli.help_display.print_help()
+
+
+def test_builtin_commands_shadow_function_names():
+    bridge = Bridge("TestCLIShadow")
+
+    def info():
+        return "function"
+
+    def greet():
+        return "hi"
+
+    bridge.register(info)
+    bridge.register(greet)
+    cli = CLI(bridge)
+    executed = []
+    cli._execute_function_command = executed.append
+    cli._handle_command("INFO")  # Built-in usage message, not the function
+    cli._handle_command("Greet")
+    assert executed == ["greet"]
+
+
+def test_functions_added_directly_dispatch_case_insensitively():
+    bridge = Bridge("TestCLIDirect")
+    bridge.register(lambda: 1, name="one")
+    cli = CLI(bridge)
+    executed = []
+    cli._execute_function_command = executed.append
+    cli._handle_command("one")
+    bridge.functions["Extra"] = Bridge("Other").register(lambda: 2, name="Extra")
+    cli._handle_command("EXTRA")
+    assert executed == ["one", "Extra"]
+
+
+def test_parameter_collection_plan_is_reused():
+    bridge = Bridge("TestCLIPlan")
+
+    def scale(values: list, factor: int = 2):
+        return [v * factor for v in values]
+
+    meta = bridge.register(scale)
+    collector = ParameterCollector(Console())
+    plan = collector._get_plan(meta)
+    assert collector._get_plan(meta) is plan
+    assert [name for name, *_ in plan] == ["values", "factor"]
+    assert plan[0][3] == collector._collect_list_param
+    menu_plan = collector._plan_param("size", MenuParamSource(["s", "l"]))
+    assert menu_plan[3] == collector._collect_menu_param
+
+
+def test_builtin_commands_dispatch_by_alias():
+    bridge = Bridge("TestCLIDispatch")
+    cli = CLI({"one": bridge, "two": Bridge("Other")})
+    assert cli._builtins["ls"] == cli._do_list
+    assert cli._handle_builtin_command("switch", ["two"])
+    assert cli.bridge.name == "Other"
+    assert not cli._handle_builtin_command("nope", [])
+
+
+def test_quit_returns_instead_of_exiting(monkeypatch):
+    bridge = Bridge("TestCLIQuit")
+    bridge.register(lambda: 1, name="one")
+    cli = CLI(bridge)
+    monkeypatch.setattr("rich.prompt.Confirm.ask", lambda *a, **k: True)
+    assert cli._handle_command("quit") is True
+    monkeypatch.setattr("rich.prompt.Confirm.ask", lambda *a, **k: False)
+    assert cli._handle_command("q") is False
+
+
+def test_importing_cli_does_not_import_rich():
+    code = "import sys, bridges.interfaces.cli; print('rich' in sys.modules)"
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip() == "False"
+
+
+def test_display_and_prompts_defer_rich_widgets():
+    code = (
+        "import sys, bridges.interfaces.cli.display, bridges.interfaces.cli.prompts; "
+        "print(sorted(m for m in ('rich.panel', 'rich.table', 'rich.prompt') "
+        "if m in sys.modules))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip() == "[]"
+
+
+def test_list_result_rendered_without_markup():
+    console = Console(file=io.StringIO(), width=80)
+    ResultDisplay(console).display_result(list(range(12)) + ["[red]x[/red]"])
+    out = console.file.getvalue()
+    assert "13 items" in out
+    assert "  4: 4" in out and "  5: 5" not in out
+    assert "... and 8 more items" in out
+
+
+def test_menu_lines_built_once(monkeypatch):
+    console = Console(file=io.StringIO(), width=80)
+    collector = ParameterCollector(console)
+    menu = MenuParamSource(["s", "l"], default="l")
+    monkeypatch.setattr("rich.prompt.Prompt.ask", lambda *a, **k: "0")
+    params = {}
+    collector._collect_menu_param("size", menu, params)
+    lines = collector._menu_lines[menu]
+    collector._collect_menu_param("size", menu, params)
+    assert collector._menu_lines[menu] is lines
+    assert params == {"size": "s"}
+    assert "→ 1: l" in console.file.getvalue()
+
+
+def test_menu_default_uses_cached_index(monkeypatch):
+    collector = ParameterCollector(Console(file=io.StringIO()))
+    menu = MenuParamSource([("Small", "s"), ("Large", "l")], default="l")
+    assert menu._default_index == 1
+    seen = {}
+
+    def ask(*args, **kwargs):
+        seen.update(kwargs)
+        return kwargs["default"]
+
+    monkeypatch.setattr("rich.prompt.Prompt.ask", ask)
+    params = {}
+    collector._collect_menu_param("size", menu, params)
+    assert params == {"size": "l"}
+    assert seen["default"] == "1"
+
+
+def test_function_info_rows():
+    def scale(value: int, factor: int = 2) -> int:
+        return value * factor
+
+    bridge = Bridge("TestInfo")
+    bridge.register(scale, output=DisplayOutputDestination())
+    console = Console(file=io.StringIO(), width=100)
+    display = HelpDisplay(console)
+    display.show_function_info(bridge, "scale")
+    output = console.file.getvalue()
+    assert "value" in output and "factor" in output
+    assert "DisplayOutputDestination" in output
+
+
+def test_function_info_follows_source_changes():
+    class Size(Enum):
+        SMALL = "s"
+        LARGE = "l"
+
+    def pick(size: Size, note: str = "x") -> str:
+        return size.value
+
+    bridge = Bridge("TestInfoChanges")
+    meta = bridge.register(pick)
+    console = Console(file=io.StringIO(), width=120)
+    display = HelpDisplay(console)
+    display.show_function_info(bridge, "pick")
+    meta.params["size"].default = Size.LARGE
+    meta.params["note"].description = "changed note"
+    console.file = io.StringIO()
+    display.show_function_info(bridge, "pick")
+    output = console.file.getvalue()
+    assert "Size.LARGE" in output
+    assert "changed note" in output
+
+
+def test_large_dict_result_rendered_as_grid():
+    console = Console(file=io.StringIO(), width=80)
+    ResultDisplay(console).display_result({f"k{i}": i for i in range(40)})
+    out = console.file.getvalue()
+    assert "40 keys" in out
+    assert "k39" in out and "│" not in out
+    console = Console(file=io.StringIO(), width=80)
+    ResultDisplay(console).display_result({"a": 1})
+    assert "│" in console.file.getvalue()
+
+
+def test_result_display_written_once():
+    class CountingIO(io.StringIO):
+        writes = 0
+
+        def write(self, text):
+            self.writes += 1
+            return super().write(text)
+
+    console = Console(file=CountingIO(), width=80)
+    ResultDisplay(console).display_result(list(range(20)))
+    assert console.file.writes == 1
+    assert "20 items" in console.file.getvalue()
+
+
+def test_scalar_result_printed_verbatim():
+    console = Console(file=io.StringIO(), width=80)
+    ResultDisplay(console).display_result("[red]raw[/red]")
+    ResultDisplay(console).display_result(42)
+    assert console.file.getvalue() == "Result: [red]raw[/red]\nResult: 42\n"
+
+
+def test_function_list_rerendered_after_register():
+    bridge = Bridge("TestList")
+    bridge.register(lambda: 1, name="first")
+    console = Console(file=io.StringIO(), width=80)
+    display = HelpDisplay(console)
+    display.list_functions(bridge)
+    cached = display._list_cache[bridge]
+    display.list_functions(bridge)
+    assert display._list_cache[bridge] is cached
+    bridge.register(lambda: 2, name="second")
+    display.list_functions(bridge)
+    assert display._list_cache[bridge] is not cached
+    assert "second" in console.file.getvalue()
+
+
+def test_function_list_follows_direct_function_edits():
+    bridge = Bridge("TestListEdits")
+    bridge.register(lambda: 1, name="one", description="first")
+    bridge.register(lambda: 2, name="two")
+    console = Console(file=io.StringIO(), width=80)
+    display = HelpDisplay(console)
+    display.list_functions(bridge)
+    del bridge.functions["two"]
+    bridge.functions["one"].description = "renamed"
+    console.file = io.StringIO()
+    display.list_functions(bridge)
+    output = console.file.getvalue()
+    assert "two" not in output
+    assert "renamed" in output
+
+
+def test_iterator_result_consumed_up_to_cap():
+    console = Console(file=io.StringIO(), width=80)
+    ResultDisplay(console).display_result(itertools.count())
+    out = console.file.getvalue()
+    assert "10+ items" in out
+    assert "  4: 4" in out and "... and more items" in out
+
+
+def test_plan_headers_parsed_once():
+    def greet(name: str):
+        return name
+
+    meta = Bridge("TestHeaders").register(
+        greet, params={"name": InputParamSource(description="Who to greet")}
+    )
+    collector = ParameterCollector(Console(file=io.StringIO()))
+    header = collector._get_plan(meta)[0][2]
+    assert header.plain == "name - Who to greet"
+    assert collector._get_plan(meta)[0][2] is header
+
+
+def test_result_display_dispatches_on_type():
+    console = Console(file=io.StringIO(), width=80)
+    display = ResultDisplay(console)
+    display.display_result(collections.OrderedDict(a=1))
+    assert display._displays[collections.OrderedDict] == display._display_dict
+    display.display_result(None)
+    assert "│" in console.file.getvalue()
+    assert "no output" in console.file.getvalue()
+
+
+def test_bridges_listing_printed_once():
+    cli = CLI({"one": Bridge("One"), "two": Bridge("Two")})
+    cli.console = Console(file=io.StringIO(), width=80)
+    cli._do_bridges([])
+    assert cli.console.file.getvalue() == "Available bridges:\none (active)\ntwo\n"
+
+
+def test_list_collector_accepts_sources_without_parse(monkeypatch):
+    class CsvSource:
+        separator = ","
+        element_type = int
+        default = None
+        description = None
+
+    collector = ParameterCollector(Console(file=io.StringIO()))
+    source = CsvSource()
+    assert collector._plan_param("values", source)[3] == collector._collect_list_param
+    monkeypatch.setattr("rich.prompt.Prompt.ask", lambda *a, **k: "1, 2")
+    params = {}
+    collector._collect_list_param("values", source, params)
+    assert params == {"values": [1, 2]}
+
+
+def test_command_split_on_any_whitespace():
+    bridge = Bridge("TestTabs")
+    bridge.register(lambda: 1, name="add")
+    cli = CLI(bridge)
+    shown = []
+    cli.help_display.show_function_info = lambda b, name: shown.append(name)
+    assert cli._handle_command("info\tadd") is False
+    assert shown == ["add"]
+
+
+def test_menu_caches_follow_reassigned_options_and_default(monkeypatch):
+    console = Console(file=io.StringIO(), width=80)
+    collector = ParameterCollector(console)
+    menu = MenuParamSource(["a", "b"])
+    menu.default = "b"
+    assert menu._default_index == 1
+    menu.options = ["a", "b", "c"]
+    assert menu._choices == ("0", "1", "2")
+    seen = {}
+
+    def ask(*args, **kwargs):
+        seen.update(kwargs)
+        return "2"
+
+    monkeypatch.setattr("rich.prompt.Prompt.ask", ask)
+    params = {}
+    collector._collect_menu_param("letter", menu, params)
+    assert params == {"letter": "c"}
+    assert seen["choices"] == ("0", "1", "2") and seen["default"] == "1"
+    menu.default = "c"
+    collector._collect_menu_param("letter", menu, params)
+    assert "→ 2: c" in console.file.getvalue()
@@ -3,7 +3,15 @@ tests.test_core_basic
 Basic tests for bridges core minimal implementation.
 """
 
+import gc
+import subprocess
+import sys
+import weakref
+
+import pytest
+
 from bridges.core.basic import Bridge
+from bridges.core.errors import BridgeValidationError
 from bridges.core.types import DisplayOutputDestination, InputParamSource
 
 
@@ -105,3 +113,281 @@ def test_stateful_class_multiple_instances():
     instances = bridge.list_all_instances()
     assert "Counter" in instances
     assert set(instances["Counter"]) == {"foo", "bar"}
+
+
+def test_register_reuses_cached_model():
+    def double(x: int) -> int:
+        return x * 2
+
+    first = Bridge("First").register(double)
+    second = Bridge("Second").register(double)
+    assert first.pydantic_model is second.pydantic_model
+    assert second({"x": "4"}) == 8
+
+
+def test_validation_returns_plain_kwargs():
+    def scale(value: int, factor: int = 3) -> int:
+        return value * factor
+
+    meta = Bridge("TestAdapter").register(scale)
+    assert meta._validate_params({"value": "2"}) == {"value": 2}
+    assert meta({"value": "2"}) == 6
+
+
+def test_validator_built_on_first_call():
+    def square(x: int) -> int:
+        return x * x
+
+    meta = Bridge("TestLazy").register(square)
+    assert meta._pydantic_model is None
+    assert meta({"x": "3"}) == 9
+    assert meta._pydantic_model is None
+
+
+def test_debug_flag_resolved_from_bridge(capsys):
+    def echo(text: str) -> str:
+        return text
+
+    bridge = Bridge("TestDebug")
+    meta = bridge.register(echo)
+    meta({"text": "quiet"})
+    assert capsys.readouterr().out == ""
+    bridge.debug = True
+    meta({"text": "loud"})
+    assert "[DEBUG] Calling echo" in capsys.readouterr().out
+
+
+def test_callable_default_resolved_at_call_time():
+    from bridges.core.types import ParameterMetadata
+
+    def shout(text: str) -> str:
+        return text.upper()
+
+    bridge = Bridge("TestCallableDefault")
+    meta = bridge.register(
+        shout,
+        params={"text": ParameterMetadata(default=lambda: bridge.context["last"])},
+    )
+    bridge.update_context("last", "hi")
+    assert meta({}) == "HI"
+
+
+def test_validators_and_callable_defaults_follow_params_changes():
+    def shout(text: str) -> str:
+        return text.upper()
+
+    meta = Bridge("TestParamsRefresh").register(shout)
+    source = meta.params["text"]
+    source.validator = lambda value: value != "no"
+    # Collected at registration; in-place edits apply after refresh_params
+    assert meta({"text": "no"}) == "NO"
+    meta.refresh_params()
+    with pytest.raises(BridgeValidationError):
+        meta({"text": "no"})
+    meta.params = {"text": InputParamSource(default=lambda: "auto")}
+    assert meta({"text": "no"}) == "NO"
+    assert meta({}) == "AUTO"
+
+
+def test_typed_values_skip_pydantic():
+    def add(a: int, b: int = 1) -> int:
+        return a + b
+
+    meta = Bridge("TestPassthrough").register(add)
+    assert meta({"a": 2}) == 3
+    assert meta._pydantic_model is None
+    assert not hasattr(meta._adapter, "validate_python")
+    assert meta._validate_params({"a": 2, "extra": 1}) == {"a": 2}
+    assert meta({"a": "2", "b": "5"}) == 7
+
+
+def test_unsupported_annotation_raises_validation_error():
+    class Point:
+        pass
+
+    def move(p: Point) -> None:
+        pass
+
+    meta = Bridge("TestUnsupported").register(move)
+    with pytest.raises(BridgeValidationError):
+        meta({"p": Point()})
+    with pytest.raises(BridgeValidationError):
+        meta.validate_and_call_json('{"p": 1}')
+    with pytest.raises(BridgeValidationError):
+        meta.validate_and_call_many([{"p": Point()}])
+
+
+def test_validate_and_call_json():
+    def add(a: int, b: int = 1) -> int:
+        return a + b
+
+    meta = Bridge("TestJson").register(add)
+    assert meta.validate_and_call_json(b'{"a": "2", "b": 3}') == 5
+    assert meta.validate_and_call_json('{"a": 2}') == 3
+    with pytest.raises(BridgeValidationError):
+        meta.validate_and_call_json(b"{not json")
+    with pytest.raises(BridgeValidationError):
+        meta.validate_and_call_json("[1, 2]")
+    hooked = Bridge("TestJsonHooked")
+    hooked.add_pre_hook(lambda params, meta: None)
+    with pytest.raises(BridgeValidationError, match="expected a JSON object"):
+        hooked.register(add).validate_and_call_json("[1, 2]")
+
+
+def test_register_with_jit_keeps_behaviour():
+    def total(n: int) -> int:
+        acc = 0
+        for i in range(n):
+            acc += i
+        return acc
+
+    meta = Bridge("TestJit").register(total, jit=True)
+    assert meta({"n": "10"}) == 45
+    assert meta.func is total
+
+
+def test_jit_with_invalid_signature_warns_and_falls_back():
+    pytest.importorskip("numba")
+
+    def inc(n: int) -> int:
+        return n + 1
+
+    with pytest.warns(RuntimeWarning, match="inc"):
+        meta = Bridge("TestJitTypo").register(inc, jit=True, signature="int64(int6)")
+    assert meta._call_target is inc
+    assert meta({"n": 1}) == 2
+
+
+def test_precompile_without_jit_is_noop():
+    def double(n: int) -> int:
+        return n * 2
+
+    meta = Bridge("TestPrecompile").register(double)
+    assert meta.precompile(int) is False
+    assert meta({"n": 3}) == 6
+
+
+def test_precompile_with_explicit_signature_returns_false():
+    numba = pytest.importorskip("numba")
+
+    def inc(n: int) -> int:
+        return n + 1
+
+    meta = Bridge("TestPrecompileSig").register(inc, jit=True, signature="int64(int64)")
+    assert meta.precompile(numba.float64) is False
+    assert meta({"n": 1}) == 2
+
+
+def test_validate_and_call_many_runs_hooks_once():
+    bridge = Bridge("TestBatch")
+    seen = []
+    bridge.add_pre_hook(lambda params, meta: seen.append(("pre", len(params))))
+    bridge.add_post_hook(lambda results, meta: seen.append(("post", results)))
+
+    def add(a: int, b: int = 1) -> int:
+        return a + b
+
+    meta = bridge.register(add)
+    assert meta.validate_and_call_many([{"a": "1", "b": 2}, {"a": 5}]) == [3, 6]
+    assert seen == [("pre", 2), ("post", [3, 6])]
+    with pytest.raises(BridgeValidationError):
+        meta.validate_and_call_many([{"a": 1}, {"a": "x"}])
+
+
+def test_output_accepts_any_iterable_of_destinations():
+    def f():
+        return 1
+
+    dest = DisplayOutputDestination()
+    bridge = Bridge("TestOutputs")
+    assert bridge.register(f, name="one", output=dest).output == [dest]
+    assert bridge.register(f, name="many", output=(d for d in [dest])).output == [dest]
+
+
+def test_register_without_pydantic_validation():
+    def echo(value: int):
+        return value
+
+    meta = Bridge("TestNoPydantic").register(echo, validate_with_pydantic=False)
+    assert meta({"value": "7"}) == "7"
+    assert meta._pydantic_model is None
+
+
+def test_identical_signatures_share_model():
+    def lookup(query: str, limit: int = 5):
+        return query, limit
+
+    def search(query: str, limit: int = 5):
+        return query, limit
+
+    def scaled(query: str, limit: float = 5.0):
+        return query, limit
+
+    bridge = Bridge("TestSharedModel")
+    first, second = bridge.register(lookup), bridge.register(search)
+    assert first.pydantic_model is second.pydantic_model
+    assert first._get_adapter() is second._get_adapter()
+    assert bridge.register(scaled).pydantic_model is not first.pydantic_model
+
+
+def test_func_name_map_refreshed_on_register():
+    bridge = Bridge("TestNameMap")
+    bridge.register(lambda: 1, name="First")
+    assert bridge._func_name_map == {"first": "First"}
+    bridge.register(lambda: 2, name="Straße")
+    assert bridge._func_name_map["strasse"] == "Straße"
+
+
+def test_lookup_finds_functions_added_directly():
+    bridge = Bridge("TestLookup")
+    bridge.register(lambda: 1, name="First")
+    assert bridge.lookup("FIRST") == "First"
+    meta = Bridge("Other").register(lambda: 2, name="Second")
+    bridge.functions["Second"] = meta
+    assert bridge.lookup("second") == "Second"
+    del bridge.functions["First"]
+    assert bridge.lookup("first") is None
+
+
+def test_core_objects_use_slots():
+    bridge = Bridge("TestSlots")
+    assert not hasattr(bridge, "__dict__")
+    assert not hasattr(InputParamSource(), "__dict__")
+    assert not hasattr(DisplayOutputDestination(), "__dict__")
+    with pytest.raises(AttributeError):
+        bridge.unknown = 1
+
+
+def test_function_names_interned():
+    bridge = Bridge("TestIntern")
+    name = "".join(["Counter", ".", "increment"])
+    meta = bridge.register(lambda: 1, name=name)
+    assert meta.name is sys.intern("Counter.increment")
+    assert next(iter(bridge._func_name_map)) is sys.intern("counter.increment")
+
+
+def test_register_class_bridge_is_garbage_collected():
+    class Counter:
+        def __init__(self):
+            self.n = 0
+
+        def inc(self):
+            self.n += 1
+            return self.n
+
+    bridge = Bridge("TestCollected")
+    bridge.register_class(Counter, methods=[{"name": "inc"}])
+    bridge.functions["create_counter_instance"]({})
+    assert bridge.functions["Counter.inc"]({}) == 1
+    ref = weakref.ref(bridge)
+    del bridge
+    gc.collect()
+    assert ref() is None
+
+
+def test_importing_core_does_not_import_numba():
+    code = "import sys, bridges.core.basic; print('numba' in sys.modules)"
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip() == "False"
@@ -1,3 +1,5 @@
+import pytest
+
 from bridges.core.basic import Bridge
 
 
@@ -8,7 +10,7 @@ def test_context_history_and_restore():
     assert bridge.context["a"] == 1
     assert bridge.context["b"] == 2
     history = bridge.get_context_history()
-    assert isinstance(history, list)
+    assert isinstance(history, tuple)
     assert len(history) >= 3
     bridge.clear_context()
     assert bridge.context == {}
@@ -16,3 +18,111 @@ def test_context_history_and_restore():
     idx = len(bridge.context_history) - 2
     bridge.restore_context(idx)
     assert "x" not in bridge.context or bridge.context["x"] != 42
+
+
+def test_restore_does_not_alias_history():
+    bridge = Bridge("TestContextAlias")
+    bridge.update_context("a", 1)
+    bridge.restore_context(1)
+    bridge.update_context("b", 2)
+    assert "b" not in bridge.get_context_history()[1]
+    assert bridge.context == {"a": 1, "b": 2}
+
+
+def test_history_rebuilt_from_change_log():
+    bridge = Bridge("TestContextLog")
+    bridge.update_context("a", 1)
+    bridge.update_context("a", 2)
+    bridge.restore_context(1)
+    bridge.update_context("b", 3)
+    assert bridge.get_context_history() == (
+        {},
+        {"a": 1},
+        {"a": 2},
+        {"a": 1},
+        {"a": 1, "b": 3},
+    )
+    bridge.restore_context(3)
+    assert bridge.context == {"a": 1}
+
+
+def test_chained_restores_rebuild_snapshots():
+    bridge = Bridge("TestContextRestoreChain")
+    bridge.update_context("a", 1)
+    bridge.update_context("b", 2)
+    bridge.restore_context(1)
+    bridge.update_context("c", 3)
+    bridge.restore_context(4)
+    assert bridge.context == {"a": 1, "c": 3}
+    assert bridge._context_log[-1] == (4, {})
+
+
+def test_instance_index_follows_restore_and_clear():
+    bridge = Bridge("TestInstances")
+    bridge.update_context("Counter_instance", object())
+    bridge.update_context("Counter_instance:foo", object())
+    assert bridge.list_all_instances() == {"Counter": ["default", "foo"]}
+    bridge.restore_context(1)
+    assert bridge.list_all_instances() == {"Counter": ["default"]}
+    bridge.clear_context()
+    assert bridge.list_all_instances() == {}
+
+
+def test_history_snapshots_are_read_only():
+    bridge = Bridge("TestContextReadOnly")
+    bridge.update_context("a", 1)
+    snapshot = bridge.get_context_history()[1]
+    with pytest.raises(TypeError):
+        snapshot["a"] = 2
+
+
+def test_restore_undoes_in_place_mutation_of_stateful_instance():
+    class Counter:
+        def __init__(self):
+            self.n = 0
+
+        def inc(self):
+            self.n += 1
+            return self.n
+
+    bridge = Bridge("TestContextStateful")
+    bridge.register_class(Counter, methods=[{"name": "inc"}])
+    bridge.functions["create_counter_instance"]({})
+    bridge.functions["Counter.inc"]({})
+    bridge.functions["Counter.inc"]({})
+    assert bridge.context["Counter_instance"].n == 2
+    bridge.restore_context(1)
+    assert bridge.context["Counter_instance"].n == 0
+    # The restored instance is a copy; using it leaves the history untouched
+    bridge.functions["Counter.inc"]({})
+    assert bridge.get_context_history()[1]["Counter_instance"].n == 0
+
+
+def test_history_keeps_values_as_logged():
+    bridge = Bridge("TestContextCopies")
+    data = {"a": 1}
+    bridge.update_context("d", data)
+    data["a"] = 99
+    assert bridge.get_context_history()[1] == {"d": {"a": 1}}
+
+
+def test_instance_listing_follows_direct_context_writes():
+    bridge = Bridge("TestInstancesDirect")
+    bridge.update_context("Counter_instance:foo", object())
+    del bridge.context["Counter_instance:foo"]
+    bridge.context["Timer_instance"] = object()
+    assert bridge.list_all_instances() == {"Timer": ["default"]}
+
+
+def test_history_records_direct_context_writes():
+    bridge = Bridge("TestContextDirect")
+    bridge.context["x"] = 1
+    bridge.update_context("y", 2)
+    assert bridge.get_context_history()[-1] == {"x": 1, "y": 2}
+    del bridge.context["x"]
+    bridge.update_context("z", 3)
+    assert bridge.get_context_history()[-1] == {"y": 2, "z": 3}
+    bridge.restore_context(1)
+    assert bridge.context == {"x": 1, "y": 2}
+    bridge.restore_context(2)
+    assert bridge.context == {"y": 2, "z": 3}
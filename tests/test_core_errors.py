@@ -27,3 +27,41 @@ def test_validation_error():
     # Simulate execution error
     with pytest.raises(ValueError):
         meta.func(-1)
+
+
+def test_custom_validator_rejects_value():
+    from bridges.core.errors import BridgeValidationError
+    from bridges.core.types import ParameterMetadata
+
+    def identity(a: int):
+        return a
+
+    bridge = Bridge("TestValidators")
+    meta = bridge.register(
+        identity, params={"a": ParameterMetadata(validator=lambda x: int(x) > 0)}
+    )
+    assert meta({"a": "5"}) == 5
+    with pytest.raises(BridgeValidationError):
+        meta({"a": "-1"})
+
+
+def test_regex_and_jit_validators():
+    from bridges.core.errors import BridgeValidationError
+    from bridges.core.types import ParameterMetadata
+
+    def tag(code: str, count: int):
+        return f"{code}:{count}"
+
+    bridge = Bridge("TestRegexValidator")
+    meta = bridge.register(
+        tag,
+        params={
+            "code": ParameterMetadata(validator=r"[A-Z]{3}"),
+            "count": ParameterMetadata(validator=lambda x: int(x) < 10, jit=True),
+        },
+    )
+    assert meta({"code": "ABC", "count": "3"}) == "ABC:3"
+    with pytest.raises(BridgeValidationError):
+        meta({"code": "abcd", "count": "3"})
+    with pytest.raises(BridgeValidationError):
+        meta({"code": "ABC", "count": "30"})
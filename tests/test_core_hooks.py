@@ -44,3 +44,17 @@ def test_event_hooks():
     except Exception:
         pass
     assert events["error"]
+
+
+def test_hooks_added_after_registration():
+    calls = []
+
+    def add(a: int, b: int):
+        return a + b
+
+    bridge = Bridge("TestLateHooks")
+    meta = bridge.register(add)
+    bridge.add_pre_hook(lambda params, meta: calls.append("pre"))
+    bridge.add_post_hook(lambda result, meta: calls.append(result))
+    assert meta({"a": 1, "b": 2}) == 3
+    assert calls == ["pre", 3]
@@ -3,8 +3,41 @@ tests.test_custom_types
 Test custom parameter sources and output destinations.
 """
 
+import gc
+import inspect
+from enum import Enum
+from typing import List
+
+import pytest
+
 from bridges.core.basic import Bridge
-from bridges.core.types import OutputDestination, ParamSource
+from bridges.core.types import (
+    FileParamSource,
+    InputParamSource,
+    ListParamSource,
+    MenuParamSource,
+    OutputDestination,
+    ParameterMetadata,
+    ParamSource,
+)
+
+
+@pytest.fixture
+def define_source():
+    """
+    Define ParamSource subclasses for one test; they are dropped from dispatch on teardown.
+    """
+    defined = []
+
+    def define(name, **namespace):
+        source_cls = type(name, (ParamSource,), namespace)
+        defined.append(source_cls)
+        return source_cls
+
+    yield define
+    defined.clear()
+    gc.collect()
+    ParamSource.invalidate_dispatch_cache()
 
 
 def test_custom_param_output():
@@ -31,3 +64,114 @@ def test_custom_param_output():
     # Simulate output
     meta.output[0].send(result, context)
     assert context["sent"] == 6
+
+
+def test_param_source_dispatch_cache_invalidated_by_new_subclass(define_source):
+    param = inspect.Parameter("a", inspect.Parameter.POSITIONAL_OR_KEYWORD)
+    ParamSource.resolve(int, param)
+    assert (int, "a", param.kind) in ParamSource._dispatch_cache
+
+    LateParam = define_source("LateParam")
+    assert ParamSource._dispatch_cache == {}
+    ParamSource.resolve(int, param)
+    assert LateParam in ParamSource._dispatch_classes
+
+
+def test_list_param_source_parse():
+    assert ListParamSource().parse("a, b") == ["a", "b"]
+    assert ListParamSource(separator=";", element_type=int).parse("1; 2") == [1, 2]
+    with pytest.raises(ValueError):
+        ListParamSource(element_type=int).parse("1,x")
+
+
+def test_menu_options_normalized():
+    class Color(Enum):
+        RED = 1
+        BLUE = 2
+
+    assert MenuParamSource(["ab", ("Label", 3)]).options == (("ab", "ab"), ("Label", 3))
+    assert MenuParamSource([["Label", 3], [1, 2, 3]]).options == (
+        ("Label", 3),
+        ("[1, 2, 3]", [1, 2, 3]),
+    )
+    param = inspect.Parameter("c", inspect.Parameter.KEYWORD_ONLY, annotation=Color)
+    first = MenuParamSource.from_param(Color, param)
+    assert first.options is MenuParamSource.from_param(Color, param).options
+    assert first.options == (("RED", Color.RED), ("BLUE", Color.BLUE))
+
+
+def test_menu_supports_only_enum_classes():
+    param = inspect.Parameter("x", inspect.Parameter.KEYWORD_ONLY)
+
+    class Size(Enum):
+        SMALL = "s"
+
+    assert MenuParamSource.supports(Size, param)
+    assert not MenuParamSource.supports(List[int], param)
+    assert not MenuParamSource.supports(None, param)
+
+
+def test_list_param_source_parse_large_numeric_input():
+    values = list(range(-100, 100))
+    raw = ", ".join(str(v) for v in values)
+    assert ListParamSource(element_type=int).parse(raw) == values
+    assert ListParamSource(element_type=float).parse(raw) == [float(v) for v in values]
+    big = raw + ", 99999999999999999999"
+    assert ListParamSource(element_type=int).parse(big)[-1] == 99999999999999999999
+    with pytest.raises(ValueError):
+        ListParamSource(element_type=int).parse(raw + ", 1.5")
+
+
+def test_list_param_source_element_type_from_annotation():
+    param = inspect.Parameter("x", inspect.Parameter.KEYWORD_ONLY)
+    assert ListParamSource.from_param(List[int], param).element_type is int
+    assert ListParamSource.from_param(list, param).element_type is str
+
+
+def test_file_param_source_read_and_stream(tmp_path):
+    path = tmp_path / "data.txt"
+    path.write_text("a\nb\n")
+    assert FileParamSource().read(str(path)) == "a\nb\n"
+    assert FileParamSource(mode="rb").read(str(path)) == b"a\nb\n"
+    lines = FileParamSource(streaming=True).read(str(path))
+    assert list(lines) == ["a\n", "b\n"]
+    assert lines.closed
+    with FileParamSource(streaming=True).read(str(path)) as lines:
+        assert next(lines) == "a\n"
+    assert lines.closed
+    assert list(lines) == []
+    unread = FileParamSource(streaming=True).read(str(path))
+    unread.close()
+    assert unread.closed
+    with pytest.raises(FileNotFoundError):
+        FileParamSource(streaming=True).read(str(tmp_path / "missing.txt"))
+
+
+def test_display_type_name_set_per_class(define_source):
+    RangeParamSource = define_source("RangeParamSource")
+
+    assert MenuParamSource._display_type_name == "Menu"
+    assert RangeParamSource._display_type_name == "Range"
+    assert ParameterMetadata._display_type_name == "any"
+
+
+def test_resolve_prefers_specific_sources_over_input():
+    class Size(Enum):
+        SMALL = "s"
+        LARGE = "l"
+
+    param = inspect.Parameter("p", inspect.Parameter.POSITIONAL_OR_KEYWORD)
+    assert ParamSource.resolve(Size, param) is MenuParamSource
+    assert ParamSource.resolve(List[int], param) is ListParamSource
+    assert ParamSource.resolve(int, param) is InputParamSource
+
+
+def test_resolve_cache_respects_parameter_dependent_supports(define_source):
+    def supports(cls, annotation, param):
+        return param.name == "a"
+
+    CtxByName = define_source("CtxByName", supports=classmethod(supports))
+    a = inspect.Parameter("a", inspect.Parameter.POSITIONAL_OR_KEYWORD)
+    b = inspect.Parameter("b", inspect.Parameter.POSITIONAL_OR_KEYWORD)
+    assert ParamSource.resolve(None, a) is CtxByName
+    assert ParamSource.resolve(None, b) is InputParamSource